@@ -11,6 +11,147 @@ try:
 except ImportError:
     NUMPY_AVAILABLE = False
 
+# Candidate digits are kept as bitmasks: bit n set = digit n (1-9)
+ALL_DIGITS = 0b1111111110
+BIT_COUNT = [bin(m).count("1") for m in range(1024)]
+
+# the 27 rows, columns and boxes as lists of (row, col)
+UNITS = ([[(r, c) for c in range(9)] for r in range(9)] +
+         [[(r, c) for r in range(9)] for c in range(9)] +
+         [[(r, c) for r in range(b // 3 * 3, b // 3 * 3 + 3) for c in range(b % 3 * 3, b % 3 * 3 + 3)] for b in range(9)])
+
+
+class DancingLinks:
+    """
+    Knuth's Algorithm X on dancing links, set up for 9x9 Sudoku as exact cover:
+    324 columns (cell filled, digit in row, digit in column, digit in box) and
+    729 rows, one per (row, col, digit) candidate. Node links live in flat
+    lists indexed by node number; node 0 is the root, 1..324 the column headers.
+    """
+    def __init__(self):
+        n = 325
+        self.left = [n - 1] + list(range(n - 1))
+        self.right = list(range(1, n)) + [0]
+        self.up = list(range(n))
+        self.down = list(range(n))
+        self.column = list(range(n))
+        self.row_id = [-1] * n
+        self.size = [0] * n
+        self.row_nodes = []  # first node of every candidate row
+        self.found = None
+
+        for rid in range(729):
+            cell, d = divmod(rid, 9)
+            row, col = divmod(cell, 9)
+            box = row // 3 * 3 + col // 3
+            columns = (1 + cell, 82 + row * 9 + d, 163 + col * 9 + d, 244 + box * 9 + d)
+            first = len(self.left)
+            for i, c in enumerate(columns):
+                node = first + i
+                self.left.append(first + (i - 1) % 4)
+                self.right.append(first + (i + 1) % 4)
+                # append at the bottom of column c
+                self.up.append(self.up[c])
+                self.down.append(c)
+                self.down[self.up[c]] = node
+                self.up[c] = node
+                self.column.append(c)
+                self.row_id.append(rid)
+                self.size[c] += 1
+            self.row_nodes.append(first)
+
+    def cover(self, c):
+        L, R, U, D, C, S = self.left, self.right, self.up, self.down, self.column, self.size
+        R[L[c]] = R[c]
+        L[R[c]] = L[c]
+        i = D[c]
+        while i != c:
+            j = R[i]
+            while j != i:
+                D[U[j]] = D[j]
+                U[D[j]] = U[j]
+                S[C[j]] -= 1
+                j = R[j]
+            i = D[i]
+
+    def uncover(self, c):
+        L, R, U, D, C, S = self.left, self.right, self.up, self.down, self.column, self.size
+        i = U[c]
+        while i != c:
+            j = L[i]
+            while j != i:
+                S[C[j]] += 1
+                D[U[j]] = j
+                U[D[j]] = j
+                j = L[j]
+            i = U[i]
+        R[L[c]] = c
+        L[R[c]] = c
+
+    def select(self, node):
+        # cover the other columns of node's row (its own column is covered by the caller)
+        j = self.right[node]
+        while j != node:
+            self.cover(self.column[j])
+            j = self.right[j]
+
+    def unselect(self, node):
+        j = self.left[node]
+        while j != node:
+            self.uncover(self.column[j])
+            j = self.left[j]
+
+    def choose_column(self):
+        # the column with the fewest rows left (Knuth's S heuristic), 0 when all are covered
+        R, S = self.right, self.size
+        best = 0
+        c = R[0]
+        while c != 0:
+            if best == 0 or S[c] < S[best]:
+                best = c
+                if S[c] <= 1: break
+            c = R[c]
+        return best
+
+    def load(self, board):
+        """ Selects the givens of board. Returns: False if two givens clash """
+        for r in range(9):
+            for c in range(9):
+                if board[r][c] != 0:
+                    node = self.row_nodes[(r * 9 + c) * 9 + board[r][c] - 1]
+                    j = node
+                    while True:
+                        col = self.column[j]
+                        if self.right[self.left[col]] != col:
+                            return False  # already covered by another given
+                        j = self.right[j]
+                        if j == node: break
+                    self.cover(self.column[node])
+                    self.select(node)
+        return True
+
+    def search(self, solution, limit=1):
+        """ Returns: number of solutions, counting stops at limit; the first one is kept in self.found """
+        if self.right[0] == 0:
+            if self.found is None:
+                self.found = list(solution)
+            return 1
+        c = self.choose_column()
+        if self.size[c] == 0:
+            return 0
+        count = 0
+        self.cover(c)
+        r = self.down[c]
+        while r != c and count < limit:
+            solution.append(self.row_id[r])
+            self.select(r)
+            count += self.search(solution, limit - count)
+            self.unselect(r)
+            solution.pop()
+            r = self.down[r]
+        self.uncover(c)
+        return count
+
 class SudokuGame:
     """
     Handles Game Logic.
@@ -21,7 +162,22 @@ class SudokuGame:
         self.original_board = [] 
         self.steps = 0      
         self.backtracks = 0 
-        
+        # digits used per row / column / 3x3 box, kept in sync by place/unplace
+        self.row_used = [0] * 9
+        self.col_used = [0] * 9
+        self.box_used = [0] * 9
+        # digits ruled out per cell by naked pairs, on top of the masks above
+        self.excluded = [[0] * 9 for _ in range(9)]
+        # CSP solver: cells filled by propagation vs. by trying a value
+        self.propagations = 0
+        self.guesses = 0
+        self.use_naked_pairs = True
+        # explicit stack of the running backtracking search (see naive_search)
+        self.search_stack = []
+        self.search_descend = True
+        # simulated annealing run in progress (see begin_annealing)
+        self.anneal_state = None
+
     def generate_puzzle(self, difficulty_level=0.5):
         try:
             from sudoku import Sudoku
@@ -45,11 +201,17 @@ class SudokuGame:
         for i in range(0, 9, 3): self.fill_box(board, i, i)
         self.solve_internal(board)
         attempts = int(difficulty * 64) + 20 
-        while attempts > 0:
-            row, col = random.randint(0, 8), random.randint(0, 8)
-            if board[row][col] != 0:
-                board[row][col] = 0
+        # only remove a clue if the puzzle keeps exactly one solution
+        cells = [(row, col) for row in range(9) for col in range(9)]
+        random.shuffle(cells)
+        for row, col in cells:
+            if attempts == 0: break
+            value = board[row][col]
+            board[row][col] = 0
+            if self.count_solutions(board, 2) == 1:
                 attempts -= 1
+            else:
+                board[row][col] = value
         return board
 
     def fill_box(self, board, row, col):
@@ -89,6 +251,39 @@ class SudokuGame:
                 if board[i + start_row][j + start_col] == num: return False
         return True
 
+    # --- BITMASK BOOKKEEPING (used by the backtracking solvers) ---
+    def init_masks(self, board):
+        self.row_used = [0] * 9
+        self.col_used = [0] * 9
+        self.box_used = [0] * 9
+        self.excluded = [[0] * 9 for _ in range(9)]
+        for r in range(9):
+            for c in range(9):
+                if board[r][c] != 0:
+                    bit = 1 << board[r][c]
+                    self.row_used[r] |= bit
+                    self.col_used[c] |= bit
+                    self.box_used[r // 3 * 3 + c // 3] |= bit
+
+    def candidates(self, row, col):
+        # digits that is_safe would accept at (row, col), as a bitmask
+        return ALL_DIGITS & ~(self.row_used[row] | self.col_used[col] | self.box_used[row // 3 * 3 + col // 3]
+                              | self.excluded[row][col])
+
+    def place(self, board, row, col, num):
+        bit = 1 << num
+        board[row][col] = num
+        self.row_used[row] |= bit
+        self.col_used[col] |= bit
+        self.box_used[row // 3 * 3 + col // 3] |= bit
+
+    def unplace(self, board, row, col):
+        bit = ~(1 << board[row][col])
+        board[row][col] = 0
+        self.row_used[row] &= bit
+        self.col_used[col] &= bit
+        self.box_used[row // 3 * 3 + col // 3] &= bit
+
     def find_empty_naive(self, board):
         for r in range(9):
             for c in range(9):
@@ -96,53 +291,303 @@ class SudokuGame:
         return None
 
     def find_mrv_cell(self, board):
+        # the masks must describe board (see init_masks)
         min_count = 10
         mrv_cell = None
         for r in range(9):
             for c in range(9):
                 if board[r][c] == 0:
-                    legal_moves = 0
-                    for num in range(1, 10):
-                        if self.is_safe(board, r, c, num): legal_moves += 1
+                    legal_moves = BIT_COUNT[self.candidates(r, c)]
                     if legal_moves < min_count:
                         min_count = legal_moves
                         mrv_cell = (r, c)
                         if min_count <= 1: return mrv_cell
         return mrv_cell
 
+    # The backtracking solvers below are plain loops over an explicit stack.
+    # solve_naive / solve_csp run a whole search without yielding (batch
+    # analysis, benchmarks); the *_generator versions drive the same loop with
+    # pause=True and hand every traced (row, col, val, steps, backtracks) to
+    # the GUI. trace, when given, is called with each of those tuples.
+
     # --- ALGORITHM 1: NAIVE BACKTRACKING ---
+    def solve_naive(self, trace=None):
+        """ Returns: True if self.board was solved in place """
+        self.init_masks(self.board)
+        self.search_stack = []
+        self.search_descend = True
+        return self.naive_search(trace)
+
     def solve_naive_generator(self):
-        empty_spot = self.find_empty_naive(self.board)
-        if not empty_spot: return True
-        row, col = empty_spot
-        for num in range(1, 10):
-            if self.is_safe(self.board, row, col, num):
-                self.board[row][col] = num
-                self.steps += 1
-                yield (row, col, num, self.steps, self.backtracks)
-                result = yield from self.solve_naive_generator()
-                if result is True: return True
-                self.board[row][col] = 0
+        self.init_masks(self.board)
+        self.search_stack = []
+        self.search_descend = True
+        events = []
+        while True:
+            result = self.naive_search(events.append, pause=True)
+            yield from events
+            events.clear()
+            if result is not None: return result
+
+    def naive_search(self, trace=None, pause=False):
+        """
+        Runs (or with pause=True, advances by one placement or undo) the search
+        stored in self.search_stack. Frames are [row, col, candidates, value].
+        Returns: True / False when the search is over, None when paused.
+        """
+        board = self.board
+        stack = self.search_stack
+        descend = self.search_descend
+        while True:
+            if descend:
+                descend = False
+                empty_spot = self.find_empty_naive(board)
+                if not empty_spot: return True
+                row, col = empty_spot
+                stack.append([row, col, self.candidates(row, col), 0])
+
+            frame = stack[-1]
+            row, col, candidates, num = frame
+            if num:
+                # the value tried last led nowhere
+                self.unplace(board, row, col)
                 self.backtracks += 1
-                yield (row, col, 0, self.steps, self.backtracks)
-        return False
+                if trace is not None: trace((row, col, 0, self.steps, self.backtracks))
+            candidates &= ~((2 << num) - 1)
+            if candidates:
+                num = (candidates & -candidates).bit_length() - 1
+                frame[3] = num
+                self.place(board, row, col, num)
+                self.steps += 1
+                if trace is not None: trace((row, col, num, self.steps, self.backtracks))
+                descend = True
+            else:
+                stack.pop()
+                if not stack: return False
+
+            if pause:
+                self.search_descend = descend
+                return None
+
+    # --- ALGORITHM 2: SMART CSP (MRV + PROPAGATION) ---
+    def solve_csp(self, trace=None):
+        """ Returns: True if self.board was solved in place """
+        self.init_masks(self.board)
+        self.propagations = 0
+        self.guesses = 0
+        self.search_stack = []
+        self.search_descend = True
+        return self.csp_search(trace)
 
-    # --- ALGORITHM 2: SMART CSP (MRV) ---
     def solve_csp_generator(self):
-        empty_spot = self.find_mrv_cell(self.board)
-        if not empty_spot: return True
-        row, col = empty_spot
-        for num in range(1, 10):
-            if self.is_safe(self.board, row, col, num):
-                self.board[row][col] = num
+        self.init_masks(self.board)
+        self.propagations = 0
+        self.guesses = 0
+        self.search_stack = []
+        self.search_descend = True
+        events = []
+        while True:
+            result = self.csp_search(events.append, pause=True)
+            yield from events
+            events.clear()
+            if result is not None: return result
+
+    def csp_search(self, trace=None, pause=False):
+        """
+        Same loop as naive_search, but every level first runs propagate and
+        branches on the MRV cell. Frames are [trail, row, col, candidates, value];
+        a level whose propagation failed gets a frame without candidates.
+        """
+        board = self.board
+        stack = self.search_stack
+        descend = self.search_descend
+        while True:
+            if descend:
+                descend = False
+                trail = []
+                if self.propagate(trail, trace):
+                    empty_spot = self.find_mrv_cell(board)
+                    if not empty_spot: return True
+                    row, col = empty_spot
+                    stack.append([trail, row, col, self.candidates(row, col), 0])
+                else:
+                    stack.append([trail, 0, 0, 0, 0])
+
+            frame = stack[-1]
+            trail, row, col, candidates, num = frame
+            if num:
+                self.unplace(board, row, col)
+                self.backtracks += 1
+                if trace is not None: trace((row, col, 0, self.steps, self.backtracks))
+            candidates &= ~((2 << num) - 1)
+            if candidates:
+                num = (candidates & -candidates).bit_length() - 1
+                frame[4] = num
+                self.place(board, row, col, num)
                 self.steps += 1
-                yield (row, col, num, self.steps, self.backtracks)
-                result = yield from self.solve_csp_generator()
-                if result is True: return True
-                self.board[row][col] = 0
+                self.guesses += 1
+                if trace is not None: trace((row, col, num, self.steps, self.backtracks))
+                descend = True
+            else:
+                # dead end: take back everything propagation did at this level
+                for entry in reversed(trail):
+                    if entry[0] == "place":
+                        self.unplace(board, entry[1], entry[2])
+                        if trace is not None: trace((entry[1], entry[2], 0, self.steps, self.backtracks))
+                    else:
+                        self.excluded[entry[1]][entry[2]] = entry[3]
+                stack.pop()
+                if not stack: return False
+
+            if pause:
+                self.search_descend = descend
+                return None
+
+    def propagate(self, trail, trace=None):
+        """
+        Forward checking, naked singles, hidden singles and (if use_naked_pairs)
+        naked pairs, repeated until nothing changes. Forced values are traced
+        like guesses and every change is recorded on trail for undo.
+        Returns False as soon as a cell or a digit has no place left.
+        """
+        board = self.board
+        changed = True
+        while changed:
+            changed = False
+
+            # forward checking + naked singles
+            for r in range(9):
+                for c in range(9):
+                    if board[r][c] == 0:
+                        cand = self.candidates(r, c)
+                        if cand == 0: return False
+                        if cand & (cand - 1) == 0:
+                            num = cand.bit_length() - 1
+                            self.force(trail, r, c, num, trace)
+                            changed = True
+
+            # hidden singles: a digit with one possible cell in a unit
+            for unit in UNITS:
+                placed = once = twice = 0
+                for r, c in unit:
+                    if board[r][c] != 0:
+                        placed |= 1 << board[r][c]
+                    else:
+                        cand = self.candidates(r, c)
+                        twice |= once & cand
+                        once |= cand
+                if ALL_DIGITS & ~placed & ~once: return False
+                hidden = once & ~twice
+                if hidden:
+                    for r, c in unit:
+                        if board[r][c] == 0 and self.candidates(r, c) & hidden:
+                            num = (self.candidates(r, c) & hidden).bit_length() - 1
+                            self.force(trail, r, c, num, trace)
+                            changed = True
+            if changed or not self.use_naked_pairs:
+                continue
+
+            # naked pairs: two cells of a unit with the same two candidates
+            # take those digits away from the rest of the unit
+            for unit in UNITS:
+                pairs = {}
+                for r, c in unit:
+                    if board[r][c] == 0:
+                        cand = self.candidates(r, c)
+                        if BIT_COUNT[cand] == 2:
+                            pairs[cand] = pairs.get(cand, 0) + 1
+                for pair, count in pairs.items():
+                    if count != 2: continue
+                    for r, c in unit:
+                        if board[r][c] == 0 and self.candidates(r, c) != pair and self.candidates(r, c) & pair:
+                            trail.append(("exclude", r, c, self.excluded[r][c]))
+                            self.excluded[r][c] |= pair
+                            changed = True
+        return True
+
+    def force(self, trail, row, col, num, trace=None):
+        self.place(self.board, row, col, num)
+        trail.append(("place", row, col))
+        self.steps += 1
+        self.propagations += 1
+        if trace is not None: trace((row, col, num, self.steps, self.backtracks))
+
+    # --- ALGORITHM 4: DANCING LINKS (EXACT COVER) ---
+    def count_solutions(self, board, limit=2):
+        """ Returns: number of solutions of board, counting stops at limit (2 is enough to check uniqueness) """
+        links = DancingLinks()
+        if not links.load(board): return 0
+        return links.search([], limit)
+
+    def solve_dlx(self):
+        """ Fast non-yielding DLX solve of self.board for batch use. Returns: True if solved """
+        links = DancingLinks()
+        if not links.load(self.board) or links.search([], 1) == 0:
+            return False
+        for rid in links.found:
+            cell, d = divmod(rid, 9)
+            self.board[cell // 9][cell % 9] = d + 1
+            self.steps += 1
+        return True
+
+    def solve_dlx_generator(self):
+        links = DancingLinks()
+        if not links.load(self.board): return False
+        self.search_stack = []
+        self.search_descend = True
+        events = []
+        while True:
+            result = self.dlx_search(links, events.append, pause=True)
+            yield from events
+            events.clear()
+            if result is not None: return result
+
+    def dlx_search(self, links, trace=None, pause=False):
+        """
+        Algorithm X over links with the board kept in step, for animation
+        (solve_dlx is the faster way to just get the answer). Frames are
+        [column, row node tried last]; the node equals the column before the first try.
+        """
+        board = self.board
+        stack = self.search_stack
+        descend = self.search_descend
+        while True:
+            if descend:
+                descend = False
+                if links.right[0] == 0: return True
+                c = links.choose_column()
+                if links.size[c] != 0:
+                    links.cover(c)
+                    stack.append([c, c])
+                elif not stack:
+                    return False
+
+            frame = stack[-1]
+            c, r = frame
+            if r != c:
+                links.unselect(r)
+                cell = links.row_id[r] // 9
+                board[cell // 9][cell % 9] = 0
                 self.backtracks += 1
-                yield (row, col, 0, self.steps, self.backtracks)
-        return False
+                if trace is not None: trace((cell // 9, cell % 9, 0, self.steps, self.backtracks))
+            r = links.down[r]
+            if r != c:
+                frame[1] = r
+                cell, d = divmod(links.row_id[r], 9)
+                row, col = divmod(cell, 9)
+                board[row][col] = d + 1
+                self.steps += 1
+                if trace is not None: trace((row, col, d + 1, self.steps, self.backtracks))
+                links.select(r)
+                descend = True
+            else:
+                links.uncover(c)
+                stack.pop()
+                if not stack: return False
+
+            if pause:
+                self.search_descend = descend
+                return None
 
     # =================================================================
     # --- ALGORITHM 3: SIMULATED ANNEALING 
@@ -198,9 +643,13 @@ class SudokuGame:
 
         return random.sample(mutable_boxes, 2)
 
-    def ProposedState(self, sudoku, fixedSudoku, listOfBlocks):
+    def ProposeSwap(self, fixedSudoku, listOfBlocks):
+        # two cells of one block to swap; the board itself is left alone
         randomBlock = random.choice(listOfBlocks)
-        boxesToFlip = self.TwoRandomBoxesWithinBlock(fixedSudoku, randomBlock)
+        return self.TwoRandomBoxesWithinBlock(fixedSudoku, randomBlock)
+
+    def ProposedState(self, sudoku, fixedSudoku, listOfBlocks):
+        boxesToFlip = self.ProposeSwap(fixedSudoku, listOfBlocks)
         
         proposedSudoku = np.copy(sudoku)
         placeHolder = proposedSudoku[boxesToFlip[0][0], boxesToFlip[0][1]]
@@ -209,6 +658,54 @@ class SudokuGame:
         
         return([proposedSudoku, boxesToFlip])
 
+    def CountDigits(self, sudoku):
+        """ Returns: (rowCounts, colCounts), 9x10 arrays of how often each digit occurs per row / column """
+        rowCounts = np.zeros((9, 10), dtype=np.int64)
+        colCounts = np.zeros((9, 10), dtype=np.int64)
+        lines = np.arange(9)
+        np.add.at(rowCounts, (lines.repeat(9), sudoku.ravel()), 1)
+        np.add.at(colCounts, (np.tile(lines, 9), sudoku.ravel()), 1)
+        return rowCounts, colCounts
+
+    def LineSwapDelta(self, counts, line, out, into):
+        # the errors of a row / column are 9 - its distinct digits: losing the
+        # last copy of out adds one, gaining a first copy of into removes one
+        return (1 if counts[line, out] == 1 else 0) - (1 if counts[line, into] == 0 else 0)
+
+    def SwapCostDifference(self, boxes, sudoku, rowCounts, colCounts):
+        """
+        Change of CalculateNumberOfErrors if the two boxes swapped values,
+        read off the count arrays in O(1). A row or column holding both boxes
+        keeps its digits and does not change.
+        """
+        (r1, c1), (r2, c2) = boxes
+        a = sudoku[r1, c1]
+        b = sudoku[r2, c2]
+        if a == b:
+            return 0
+        costDifference = 0
+        if r1 != r2:
+            costDifference += self.LineSwapDelta(rowCounts, r1, a, b) + self.LineSwapDelta(rowCounts, r2, b, a)
+        if c1 != c2:
+            costDifference += self.LineSwapDelta(colCounts, c1, a, b) + self.LineSwapDelta(colCounts, c2, b, a)
+        return costDifference
+
+    def ApplySwap(self, boxes, sudoku, rowCounts, colCounts):
+        # swap in place and keep the count arrays in step
+        (r1, c1), (r2, c2) = boxes
+        a = sudoku[r1, c1]
+        b = sudoku[r2, c2]
+        sudoku[r1, c1] = b
+        sudoku[r2, c2] = a
+        rowCounts[r1, a] -= 1
+        rowCounts[r1, b] += 1
+        rowCounts[r2, b] -= 1
+        rowCounts[r2, a] += 1
+        colCounts[c1, a] -= 1
+        colCounts[c1, b] += 1
+        colCounts[c2, b] -= 1
+        colCounts[c2, a] += 1
+
     def CalculateInitialSigma(self, sudoku, fixedSudoku, listOfBlocks):
         listOfDifferences = []
         tmpSudoku = np.copy(sudoku)
@@ -229,11 +726,30 @@ class SudokuGame:
                     numberOfItterations += 1
         return numberOfItterations
 
+    def solve_annealing(self, trace=None):
+        """
+        Runs the User's Simulated Annealing logic (Fixed) without yielding.
+        trace, when given, gets the same tuples the generator yields.
+        Returns: True once the board has no errors left, False without numpy
+        """
+        if not self.begin_annealing(trace): return False
+        return self.annealing_search(trace)
+
     def solve_annealing_generator(self):
         """
         Runs the User's Simulated Annealing logic (Fixed).
         Yields state updates for the GUI.
         """
+        events = []
+        if not self.begin_annealing(events.append): return False
+        while True:
+            result = self.annealing_search(events.append, pause=True)
+            yield from events
+            events.clear()
+            if result is not None: return result
+
+    def begin_annealing(self, trace=None):
+        """ Random fill and initial temperature; the run itself is kept in self.anneal_state. Returns: False without numpy """
         if not NUMPY_AVAILABLE:
             print("Error: Numpy not installed. Cannot run SA.")
             return False
@@ -260,45 +776,70 @@ class SudokuGame:
             for c in range(9):
                 if self.original_board[r][c] == 0:
                     self.board[r][c] = int(tmpSudoku[r,c])
-                    yield (r, c, int(tmpSudoku[r,c]), 0, 0)
-        
-        sigma = self.CalculateInitialSigma(sudoku, fixedSudoku, listOfBlocks)
-        score = self.CalculateNumberOfErrors(tmpSudoku)
-        itterations = self.ChooseNumberOfItterations(fixedSudoku)
-        
-        solutionFound = 0
-        if score <= 0: solutionFound = 1
+                    if trace is not None: trace((r, c, int(tmpSudoku[r,c]), 0, 0))
         
+        # per-row / per-column digit counts: a proposal is priced from these
+        # instead of copying the board and running np.unique on it
+        rowCounts, colCounts = self.CountDigits(tmpSudoku)
+        self.anneal_state = {
+            "sudoku": tmpSudoku,
+            "fixedSudoku": fixedSudoku,
+            "listOfBlocks": listOfBlocks,
+            "rowCounts": rowCounts,
+            "colCounts": colCounts,
+            "sigma": self.CalculateInitialSigma(sudoku, fixedSudoku, listOfBlocks),
+            "score": self.CalculateNumberOfErrors(tmpSudoku),
+            "itterations": self.ChooseNumberOfItterations(fixedSudoku),
+            "previousScore": 0,
+            "stuckCount": 0,
+            "step_count": 0,
+            "i": 0,  # proposals made in the current temperature round
+        }
+        return True
+
+    def annealing_search(self, trace=None, pause=False):
+        """
+        Runs (or with pause=True, advances by one accepted swap or one cooling
+        step) the annealing run in self.anneal_state.
+        Returns: True once the score reaches 0, None when paused.
+        """
+        state = self.anneal_state
+        tmpSudoku = state["sudoku"]
+        fixedSudoku = state["fixedSudoku"]
+        listOfBlocks = state["listOfBlocks"]
+        rowCounts = state["rowCounts"]
+        colCounts = state["colCounts"]
+        itterations = state["itterations"]
+        sigma = state["sigma"]
+        score = state["score"]
+        previousScore = state["previousScore"]
+        stuckCount = state["stuckCount"]
+        step_count = state["step_count"]
+        i = state["i"]
         decreaseFactor = 0.99
-        stuckCount = 0
-        step_count = 0
-        
+
         # 3. Main Loop
-        while solutionFound == 0:
-            previousScore = score
-            
-            for i in range(0, itterations):
+        while score > 0:
+            if i == 0:
+                previousScore = score
+            paused = False
+
+            if i < itterations:
+                i += 1
                 step_count += 1
                 
                 # Propose New State
-                proposal = self.ProposedState(tmpSudoku, fixedSudoku, listOfBlocks)
-                newSudoku = proposal[0]
-                boxesToCheck = proposal[1]
+                boxesToCheck = self.ProposeSwap(fixedSudoku, listOfBlocks)
                 
                 # Calculate Cost
-                currentCost = self.CalculateNumberOfErrorsRowColumn(boxesToCheck[0][0], boxesToCheck[0][1], tmpSudoku) + \
-                              self.CalculateNumberOfErrorsRowColumn(boxesToCheck[1][0], boxesToCheck[1][1], tmpSudoku)
-                newCost = self.CalculateNumberOfErrorsRowColumn(boxesToCheck[0][0], boxesToCheck[0][1], newSudoku) + \
-                          self.CalculateNumberOfErrorsRowColumn(boxesToCheck[1][0], boxesToCheck[1][1], newSudoku)
-                
-                costDifference = newCost - currentCost
+                costDifference = self.SwapCostDifference(boxesToCheck, tmpSudoku, rowCounts, colCounts)
                 
                 # Metropolis Acceptance Criterion
                 rho = math.exp(-costDifference/sigma) if sigma > 0 else 0
                 
                 if(np.random.uniform(1,0,1) < rho):
                     # Accept Change
-                    tmpSudoku = newSudoku
+                    self.ApplySwap(boxesToCheck, tmpSudoku, rowCounts, colCounts)
                     score += costDifference
                     
                     # Visual Sync: Update swapped cells on GUI
@@ -310,68 +851,79 @@ class SudokuGame:
                     self.board[r1][c1] = val1
                     self.board[r2][c2] = val2
                     
-                    yield (r1, c1, val1, step_count, score)
-                    yield (r2, c2, val2, step_count, score)
+                    if trace is not None:
+                        trace((r1, c1, val1, step_count, score))
+                        trace((r2, c2, val2, step_count, score))
+                    paused = pause
+            else:
+                # Cooling Schedule
+                i = 0
+                sigma *= decreaseFactor
                     
-                    if score <= 0:
-                        solutionFound = 1
-                        break
-
-            # Cooling Schedule
-            sigma *= decreaseFactor
-            if score <= 0:
-                solutionFound = 1
-                break
+                # Stuck Logic
+                if score >= previousScore:
+                    stuckCount += 1
+                else:
+                    stuckCount = 0
+                if (stuckCount > 80):
+                    sigma += 2
                 
-            # Stuck Logic
-            if score >= previousScore:
-                stuckCount += 1
-            else:
-                stuckCount = 0
-            if (stuckCount > 80):
-                sigma += 2
-            
-            # Keep GUI alive
-            yield (-1, -1, 0, step_count, score)
+                # Keep GUI alive
+                if trace is not None: trace((-1, -1, 0, step_count, score))
+                paused = pause
+
+            if paused:
+                state["sigma"] = sigma
+                state["score"] = score
+                state["previousScore"] = previousScore
+                state["stuckCount"] = stuckCount
+                state["step_count"] = step_count
+                state["i"] = i
+                return None
 
         return True
 
     # --- BATCH ANALYSIS TOOL ---
     def run_batch_analysis(self, algorithm_name, trials=10):
         total_time = 0
+        total_steps = 0
         success_count = 0
-        
+
         for _ in range(trials):
             self.board = [row[:] for row in self.original_board]
             self.steps = 0
-            
+            self.backtracks = 0
+
             start = time.perf_counter()
-            
-            if "Smart" in algorithm_name:
-                gen = self.solve_csp_generator()
-            elif "Naive" in algorithm_name:
-                gen = self.solve_naive_generator()
-            else:
-                gen = self.solve_annealing_generator()
 
+            # every solver runs its non-yielding version, so the timing
+            # measures the search and not the generator plumbing
+            solved = False
             try:
-                while True:
-                    next(gen)
-            except StopIteration:
-                pass 
+                if "Smart" in algorithm_name:
+                    solved = self.solve_csp()
+                elif "DLX" in algorithm_name:
+                    solved = self.solve_dlx()
+                elif "Naive" in algorithm_name:
+                    solved = self.solve_naive()
+                else:
+                    solved = self.solve_annealing()
             except Exception:
                 pass
-                
+
             end = time.perf_counter()
-            success_count += 1
+            if solved:
+                success_count += 1
             total_time += (end - start)
-            
+            total_steps += self.steps
+
         avg_time = total_time / trials if trials > 0 else 0
-        
+        avg_steps = total_steps / trials if trials > 0 else 0
+
         return {
             "algo": algorithm_name,
             "trials": trials,
             "success_rate": f"{success_count}/{trials}",
             "avg_time": f"{avg_time:.4f}s",
-            "avg_steps": "N/A"
+            "avg_steps": f"{avg_steps:.0f}" if total_steps else "N/A"
         }
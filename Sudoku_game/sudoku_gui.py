@@ -86,7 +86,7 @@ class SudokuGUI:
         algo_combo = ttk.Combobox(
             algo_frame, 
             textvariable=self.algo_var, 
-            values=["Smart CSP (MRV)", "Naive Backtracking", "Simulated Annealing (Numpy)"], 
+            values=["Smart CSP (MRV)", "Dancing Links (DLX)", "Naive Backtracking", "Simulated Annealing (Numpy)"], 
             state="readonly", 
             width=25,
             font=("Helvetica", 11),
@@ -202,6 +202,8 @@ class SudokuGUI:
         # Select Generator
         if "Smart" in algo_choice:
             solver = self.game.solve_csp_generator() 
+        elif "DLX" in algo_choice:
+            solver = self.game.solve_dlx_generator()
         elif "Naive" in algo_choice:
             solver = self.game.solve_naive_generator()
         else:
@@ -227,7 +229,11 @@ class SudokuGUI:
                         cell.insert(0, str(val))
                         cell.config(bg="#E1BEE7") # Purple for annealing
                 else:
-                    self.stats_label.config(text=f"Steps: {metric1}  |  Backtracks: {metric2}")
+                    if "Smart" in algo_choice:
+                        self.stats_label.config(text=f"Steps: {metric1}  |  Backtracks: {metric2}  |  "
+                                                     f"Guesses: {self.game.guesses}  |  Propagated: {self.game.propagations}")
+                    else:
+                        self.stats_label.config(text=f"Steps: {metric1}  |  Backtracks: {metric2}")
                     cell = self.cells[(row, col)]
                     cell.delete(0, tk.END)
                     if val != 0:
@@ -0,0 +1,149 @@
+"""
+Headless batch solving for the sliding puzzle.
+
+Reads one start state per line (e.g. "867254301", "1 2 3 4 5 6 7 8 0" or
+"123456789ABCDEF0"), solves every state with every requested algorithm on a
+process pool and streams one result per (state, algorithm) as JSON lines or CSV.
+A solution is written as its move string (U/L/D/R, the direction the blank
+moves), not as the list of boards.
+
+    python eight_puzzle_batch.py states.txt -a greedy astar -w 8 -f csv -o results.csv
+    python eight_puzzle_batch.py states.txt -a astar --heuristic "linear conflict"
+
+Blank lines and lines starting with '#' are skipped. A state that makes a solver
+fail is reported as a row with status "error" instead of stopping the batch.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from eight_puzzle_engine import TILE_CHARS, DistanceTable, PatternDatabase, run_solver
+
+# command-line names -> run_solver modes ("a*" needs quoting in most shells)
+ALGORITHMS = {
+    "greedy": "greedy",
+    "astar": "a*",
+    "a*": "a*",
+    "weighted": "weighted a*",
+    "ara": "ara*",
+    "ara*": "ara*",
+    "ida": "ida*",
+    "ida*": "ida*",
+    "bidirectional": "bidirectional",
+    "table": "table",
+    "bfs": "bfs",
+}
+
+HEURISTICS = ("manhattan", "linear conflict", "pdb")
+
+FIELDS = ["index", "start", "algorithm", "status", "steps", "moves", "expanded", "seconds", "message"]
+
+
+def parse_state(line):
+    """ "1 2 3 ... 0" (one number per tile) or one character per tile -> board string """
+    tokens = line.replace(",", " ").split()
+    if len(tokens) > 1 and all(t.isdigit() and int(t) < len(TILE_CHARS) for t in tokens):
+        return "".join(TILE_CHARS[int(t)] for t in tokens)
+    return "".join(tokens).upper()
+
+
+def read_states(path):
+    states = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            states.append(parse_state(line))
+    return states
+
+
+def solve_one(task):
+    """Worker entry point: task is (index, start_state, mode, max_nodes, heuristic)"""
+    index, start_state, mode, max_nodes, heuristic = task
+    try:
+        res = run_solver(start_state, mode, max_nodes, heuristic=heuristic)
+    except Exception as e:
+        # one bad row must not abort the whole stream (pool.map re-raises in the parent)
+        return {
+            "index": index,
+            "start": start_state,
+            "algorithm": mode,
+            "status": "error",
+            "steps": 0,
+            "moves": "",
+            "expanded": 0,
+            "seconds": 0.0,
+            "message": "%s: %s" % (type(e).__name__, e),
+        }
+    return {
+        "index": index,
+        "start": res.start,
+        "algorithm": mode,
+        "status": res.status,
+        "steps": res.steps,
+        "moves": res.moves,
+        "expanded": res.expanded,
+        "seconds": round(res.seconds, 6),
+        "message": res.message,
+    }
+
+
+def solve_batch(states, algorithms=("greedy", "a*"), workers=None, max_nodes=None, heuristic="manhattan"):
+    """Yields one result dict per (state, algorithm), in input order, as soon as it is ready"""
+    tasks = [(i, state, mode, max_nodes, heuristic) for i, state in enumerate(states) for mode in algorithms]
+    # build the table files once here instead of racing to build them in every worker
+    if "table" in algorithms:
+        DistanceTable.load()
+    if heuristic == "pdb":
+        PatternDatabase.load()
+    if workers == 1:
+        for task in tasks:
+            yield solve_one(task)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # small chunks keep every core busy while results still stream out
+        chunksize = max(1, len(tasks) // ((workers or os.cpu_count() or 1) * 8))
+        for row in pool.map(solve_one, tasks, chunksize=chunksize):
+            yield row
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve many sliding-puzzle start states in parallel.")
+    parser.add_argument("input", help="file with one start state per line")
+    parser.add_argument("-a", "--algorithms", nargs="+", default=["greedy", "astar"],
+                        choices=sorted(ALGORITHMS), help="algorithms to run on every state")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("-f", "--format", choices=["jsonl", "csv"], default="jsonl")
+    parser.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+    parser.add_argument("--max-nodes", type=int, default=None, help="expansion budget per search")
+    parser.add_argument("--heuristic", choices=HEURISTICS, default="manhattan",
+                        help="heuristic of the informed searches (pdb: 3x3 only)")
+    args = parser.parse_args(argv)
+
+    states = read_states(args.input)
+    modes = [ALGORITHMS[name] for name in args.algorithms]
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    try:
+        writer = None
+        if args.format == "csv":
+            writer = csv.DictWriter(out, fieldnames=FIELDS)
+            writer.writeheader()
+        for row in solve_batch(states, modes, args.workers, args.max_nodes, args.heuristic):
+            if writer is not None:
+                writer.writerow(row)
+            else:
+                out.write(json.dumps(row) + "\n")
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
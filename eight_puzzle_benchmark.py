@@ -0,0 +1,236 @@
+"""
+Reproducible benchmark of every sliding-puzzle search mode.
+
+Builds a seeded corpus of 3x3 boards with a fixed number of instances per
+optimal depth (0..31, read from the precomputed distance table), runs every
+search mode over it and records wall time, nodes expanded, peak frontier size,
+peak RSS and the gap to the optimal solution length. Results are written as
+JSON; passing an earlier results file prints a comparison and exits with
+status 1 when a mode got slower, expanded more nodes or lost optimality.
+
+    python eight_puzzle_benchmark.py -o bench.json
+    python eight_puzzle_benchmark.py -o new.json --compare bench.json
+    python eight_puzzle_benchmark.py --verify   # optimal modes vs plain BFS
+
+Every mode runs in a fresh worker process, so its peak RSS is not polluted by
+the modes that ran before it.
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+from eight_puzzle_engine import FACTORIALS, TILE_CHARS, DistanceTable, Solver, verify_optimality
+
+MODES = ("greedy", "a*", "weighted a*", "ara*", "ida*", "bidirectional", "table", "bfs")
+
+SOLVE_METHODS = {
+    "greedy": "SolveByGreedy",
+    "a*": "SolveByAstar",
+    "weighted a*": "SolveByWeightedAstar",
+    "ara*": "SolveByARAstar",
+    "ida*": "SolveByIDAstar",
+    "bidirectional": "SolveByBidirectional",
+    "table": "SolveByTable",
+    "bfs": "SolveByBFS",
+}
+
+MAX_DEPTH = 31
+
+
+def unrank(rank):
+    """ Inverse of permutationRank. Returns: board string """
+    remaining = list(range(9))
+    tiles = []
+    for i in range(9):
+        index, rank = divmod(rank, FACTORIALS[i])
+        tiles.append(remaining.pop(index))
+    return "".join(TILE_CHARS[t] for t in tiles)
+
+
+def make_corpus(seed=0, per_depth=3, depths=range(MAX_DEPTH + 1)):
+    """ Returns: [(optimal depth, board string)], the same list for the same arguments """
+    data = DistanceTable.load().data
+    buckets = {d: [] for d in depths}
+    for rank in range(FACTORIALS[0] * 9):
+        entry = data[4 + rank]
+        if entry != 255 and entry & 31 in buckets:
+            buckets[entry & 31].append(rank)
+
+    rng = random.Random(seed)
+    corpus = []
+    for d in depths:
+        # depths 0 and 31 have only one and two boards, so take what exists
+        for rank in sorted(rng.sample(buckets[d], min(per_depth, len(buckets[d])))):
+            corpus.append((d, unrank(rank)))
+    return corpus
+
+
+def peak_rss_kb():
+    """ Returns: peak resident set size of this process in KiB, or None where unsupported """
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def run_mode(mode, corpus, max_nodes=None, repeat=3):
+    """ Worker entry point. Returns: (result rows, peak RSS in KiB) for one mode over the corpus """
+    DistanceTable.load()  # map the table before timing anything
+    rows = []
+    for depth, num in corpus:
+        best = None
+        for _ in range(repeat):
+            s = Solver(maxNodes=max_nodes)
+            start = time.perf_counter()
+            getattr(s, SOLVE_METHODS[mode])(num)
+            seconds = time.perf_counter() - start
+            if best is None or seconds < best:
+                best = seconds
+        rows.append({
+            "mode": mode,
+            "depth": depth,
+            "start": num,
+            "status": s.status,
+            "steps": s.steps,
+            "gap": s.steps - depth if s.status == "solved" else None,
+            "expanded": s.expanded,
+            "peak_frontier": s.peakFrontier,
+            "seconds": round(best, 6),
+        })
+    return rows, peak_rss_kb()
+
+
+def summarize(rows, rss):
+    solved = [r for r in rows if r["status"] == "solved"]
+    return {
+        "instances": len(rows),
+        "solved": len(solved),
+        "seconds": round(sum(r["seconds"] for r in rows), 6),
+        "expanded": sum(r["expanded"] for r in rows),
+        "peak_frontier": max((r["peak_frontier"] for r in rows), default=0),
+        "peak_rss_kb": rss,
+        "nonoptimal": sum(1 for r in solved if r["gap"] != 0),
+        "max_gap": max((r["gap"] for r in solved), default=0),
+        "mean_gap": round(sum(r["gap"] for r in solved) / len(solved), 3) if solved else None,
+    }
+
+
+def run_benchmark(seed=0, per_depth=3, modes=MODES, max_nodes=None, repeat=3):
+    """ Returns: {"meta": ..., "summary": {mode: ...}, "results": [rows]} """
+    DistanceTable.load()  # generate the table file once, before the workers need it
+    corpus = make_corpus(seed, per_depth)
+    results = []
+    summary = {}
+    for mode in modes:
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            rows, rss = pool.submit(run_mode, mode, corpus, max_nodes, repeat).result()
+        results.extend(rows)
+        summary[mode] = summarize(rows, rss)
+    meta = {
+        "seed": seed,
+        "per_depth": per_depth,
+        "instances": len(corpus),
+        "max_nodes": max_nodes,
+        "repeat": repeat,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+    return {"meta": meta, "summary": summary, "results": results}
+
+
+def compare(current, previous, tolerance=0.10):
+    """ Returns: (report lines, regressions); wall time may grow by `tolerance` before it counts """
+    lines = []
+    regressions = []
+    for key in ("seed", "per_depth", "max_nodes"):
+        if current["meta"].get(key) != previous["meta"].get(key):
+            lines.append("warning: %s differs (%s vs %s), runs are not directly comparable"
+                         % (key, current["meta"].get(key), previous["meta"].get(key)))
+
+    lines.append("%-14s %22s %22s %18s %18s %9s" % ("mode", "seconds", "expanded", "peak frontier", "peak RSS KiB", "nonopt"))
+    for mode, now in current["summary"].items():
+        before = previous["summary"].get(mode)
+        if before is None:
+            lines.append("%-14s (new)" % mode)
+            continue
+
+        def cell(key):
+            old, new = before.get(key), now.get(key)
+            if old in (None, 0) or new is None:
+                return "%s -> %s" % (old, new)
+            return "%s -> %s %+.0f%%" % (old, new, 100.0 * (new - old) / old)
+
+        lines.append("%-14s %22s %22s %18s %18s %9s" % (
+            mode, cell("seconds"), cell("expanded"), cell("peak_frontier"), cell("peak_rss_kb"),
+            "%d -> %d" % (before["nonoptimal"], now["nonoptimal"])))
+
+        if now["seconds"] > before["seconds"] * (1 + tolerance):
+            regressions.append("%s: wall time %.4fs -> %.4fs" % (mode, before["seconds"], now["seconds"]))
+        if now["expanded"] > before["expanded"]:
+            regressions.append("%s: nodes expanded %d -> %d" % (mode, before["expanded"], now["expanded"]))
+        if now["nonoptimal"] > before["nonoptimal"] or now["solved"] < before["solved"]:
+            regressions.append("%s: %d/%d solved optimally, was %d/%d" % (
+                mode, now["solved"] - now["nonoptimal"], now["instances"],
+                before["solved"] - before["nonoptimal"], before["instances"]))
+    return lines, regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark every sliding-puzzle search mode on a seeded corpus.")
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument("-n", "--per-depth", type=int, default=3, help="instances per optimal depth 0..31")
+    parser.add_argument("-m", "--modes", nargs="+", default=list(MODES), choices=MODES)
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="runs per instance, the fastest is kept")
+    parser.add_argument("--max-nodes", type=int, default=None, help="expansion budget per search")
+    parser.add_argument("-o", "--output", default=None, help="write the JSON results here")
+    parser.add_argument("-c", "--compare", default=None, help="earlier JSON results to compare against")
+    parser.add_argument("-t", "--tolerance", type=float, default=0.10, help="allowed wall time growth (0.10 = 10%%)")
+    parser.add_argument("--verify", action="store_true",
+                        help="only check the optimal modes against plain BFS on the corpus, then exit")
+    args = parser.parse_args(argv)
+
+    if args.verify:
+        corpus = make_corpus(args.seed, args.per_depth)
+        mismatches = verify_optimality([num for _, num in corpus])
+        for num, mode, steps, best in mismatches:
+            print("%s %-14s %s steps, BFS needs %s" % (num, mode, steps, best))
+        print("%d boards, %d mismatches" % (len(corpus), len(mismatches)))
+        return 1 if mismatches else 0
+
+    current = run_benchmark(args.seed, args.per_depth, args.modes, args.max_nodes, args.repeat)
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump(current, f, indent=1)
+
+    for mode, s in current["summary"].items():
+        print("%-14s %3d/%d solved  %9.4fs  %9d expanded  peak frontier %7d  peak RSS %s KiB  nonoptimal %d (max gap %d)" % (
+            mode, s["solved"], s["instances"], s["seconds"], s["expanded"], s["peak_frontier"],
+            s["peak_rss_kb"], s["nonoptimal"], s["max_gap"]))
+
+    if args.compare is not None:
+        with open(args.compare) as f:
+            previous = json.load(f)
+        lines, regressions = compare(current, previous, args.tolerance)
+        print()
+        print("\n".join(lines))
+        if regressions:
+            print()
+            print("REGRESSIONS:")
+            print("\n".join("  " + r for r in regressions))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1643 @@
+"""
+Sliding-puzzle search engine shared by the 8-puzzle GUIs and the headless tools.
+
+Nothing here imports tkinter, so batch workers and benchmarks can import it
+directly; the GUIs import it lazily on their first solve.
+"""
+import time
+import math
+import os
+import mmap
+import json
+import heapq
+import threading
+from collections import OrderedDict, deque
+
+
+class PriorityQueue:
+    # binary min-heap ordered by (priority, h, insertion order)
+    # index maps a state key to its slot in the heap, so a state that is
+    # found again with a better priority is updated in place (decrease-key)
+    # instead of being pushed a second time
+    def __init__(self, key=None):
+        # entries: [(priority, h, order), key, data]; the rank tuple is
+        # compared as is, so sifting allocates nothing
+        self.heap = []
+        self.index = {}
+        self.counter = 0
+        self.key = key if key is not None else (lambda data: data)
+
+    def enqueue(self, data, priority, h=0):
+        k = self.key(data)
+        pos = self.index.get(k)
+        if pos is not None:
+            entry = self.heap[pos]
+            if priority < entry[0][0]:
+                entry[0] = (priority, h, entry[0][2])
+                entry[2] = data
+                self.siftUp(pos)
+                return True
+            return False  # already queued with an equal or better priority
+
+        entry = [(priority, h, self.counter), k, data]
+        self.counter += 1
+        self.heap.append(entry)
+        self.index[k] = len(self.heap) - 1
+        self.siftUp(len(self.heap) - 1)
+        return True
+
+    def dequeue(self):
+        if self.isEmpty():
+            raise Exception("Priority Queue is empty")
+
+        heap = self.heap
+        top = heap[0]
+        last = heap.pop()
+        del self.index[top[1]]
+        if heap:
+            heap[0] = last
+            self.index[last[1]] = 0
+            self.siftDown(0)
+        return top[2]
+
+    def peek(self):
+        if self.isEmpty():
+            raise Exception("Priority Queue is empty")
+        return self.heap[0][2]
+
+    def isEmpty(self):
+        return len(self.heap) == 0
+
+    def size(self):
+        return len(self.heap)
+
+    def printQueue(self):
+        for entry in sorted(self.heap):
+            print("(" + str(entry[2]) + ", priority: " + str(entry[0][0]) + ") -> ", end="")
+        print("null")
+
+    def inFrontier(self, c):
+        return self.key(c) in self.index
+
+    def siftUp(self, pos):
+        heap = self.heap
+        index = self.index
+        entry = heap[pos]
+        rank = entry[0]
+        while pos > 0:
+            parentPos = (pos - 1) >> 1
+            parent = heap[parentPos]
+            if rank < parent[0]:
+                heap[pos] = parent
+                index[parent[1]] = pos
+                pos = parentPos
+            else:
+                break
+        heap[pos] = entry
+        index[entry[1]] = pos
+
+    def siftDown(self, pos):
+        heap = self.heap
+        index = self.index
+        n = len(heap)
+        entry = heap[pos]
+        rank = entry[0]
+        while True:
+            child = 2 * pos + 1
+            if child >= n:
+                break
+            right = child + 1
+            if right < n and heap[right][0] < heap[child][0]:
+                child = right
+            if heap[child][0] < rank:
+                heap[pos] = heap[child]
+                index[heap[pos][1]] = pos
+                pos = child
+            else:
+                break
+        heap[pos] = entry
+        index[entry[1]] = pos
+
+
+# tiles are written one character each, so boards up to 6x6 fit in a string
+# ("123456789ABCDEF0" is the 4x4 goal)
+TILE_CHARS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+class SlidingTables:
+    # lookup tables shared by every board of one size, built once per size
+    def __init__(self, size):
+        self.size = size
+        self.cells = size * size
+        self.goal = TILE_CHARS[1:self.cells] + "0"
+
+        # packed state layout: bits per cell, cell 0 in the top bits
+        self.bits = max(4, (self.cells - 1).bit_length())
+        self.mask = (1 << self.bits) - 1
+        self.shifts = tuple(self.bits * (self.cells - 1 - pos) for pos in range(self.cells))
+
+        # neighbors[pos]: cells the blank can move to from pos
+        neighbors = []
+        for pos in range(self.cells):
+            r, c = pos // size, pos % size
+            adj = []
+            if r > 0: adj.append(pos - size)
+            if c > 0: adj.append(pos - 1)
+            if r < size - 1: adj.append(pos + size)
+            if c < size - 1: adj.append(pos + 1)
+            neighbors.append(tuple(adj))
+        self.neighbors = tuple(neighbors)
+
+        # manhattan[tile][pos]: distance from cell pos to the goal cell of tile
+        # (row 0 is the blank, which never counts)
+        self.manhattan = tuple(
+            tuple(0 if tile == 0 else abs(pos // size - (tile - 1) // size) + abs(pos % size - (tile - 1) % size)
+                  for pos in range(self.cells))
+            for tile in range(self.cells))
+
+        # linear-conflict penalty per (line, tiles in that line), filled lazily
+        self.lineConflicts = {}
+
+
+slidingTablesCache = {}
+
+
+def slidingTables(size):
+    if size not in slidingTablesCache:
+        slidingTablesCache[size] = SlidingTables(size)
+    return slidingTablesCache[size]
+
+
+def parseTiles(num):
+    return [TILE_CHARS.index(c) for c in num.upper()]
+
+
+def isSolvable(num):
+    # inversion parity: on odd widths the inversion count must be even, on
+    # even widths inversions + blank row (counted from the bottom) must be odd
+    tiles = parseTiles(num)
+    size = math.isqrt(len(tiles))
+    order = [t for t in tiles if t != 0]
+    inversions = 0
+    for i in range(len(order)):
+        for j in range(i + 1, len(order)):
+            if order[i] > order[j]:
+                inversions += 1
+    if size % 2 == 1:
+        return inversions % 2 == 0
+    return (inversions + size - tiles.index(0) // size) % 2 == 1
+
+
+def validateBoard(num):
+    # None when num is a permutation of the tiles 0 .. n*n - 1, otherwise
+    # the reason it cannot be a board
+    if not isinstance(num, str) or num == "":
+        return "The board must be a non-empty string."
+    size = math.isqrt(len(num))
+    if size * size != len(num) or size < 2:
+        return "A board needs n x n tiles (9, 16, 25, ...), got " + str(len(num)) + "."
+    tiles = []
+    for c in num.upper():
+        if c not in TILE_CHARS[:len(num)]:
+            return "'" + c + "' is not a tile of a " + str(size) + "x" + str(size) + " board."
+        tiles.append(TILE_CHARS.index(c))
+    if len(set(tiles)) != len(tiles):
+        return "Every tile from 0 to " + str(len(num) - 1) + " must appear exactly once."
+    return None
+
+
+# a solution is stored as the start board plus one letter per move, the
+# direction the blank moves in; index i of MOVES is 2-bit code i
+MOVES = "ULDR"
+
+
+def moveOffsets(size):
+    return (-size, -1, size, 1)
+
+
+def pathToMoves(path):
+    """ Returns: the move string that walks path (a list of board strings) """
+    size = math.isqrt(len(path[0]))
+    offsets = moveOffsets(size)
+    moves = []
+    blank = path[0].index("0")
+    for board in path[1:]:
+        nextBlank = board.index("0")
+        moves.append(MOVES[offsets.index(nextBlank - blank)])
+        blank = nextBlank
+    return "".join(moves)
+
+
+def movesToPath(start, moves):
+    """ Returns: [start, board after move 1, ...] """
+    return list(MovePath(start, moves))
+
+
+def packMoves(moves):
+    """ Returns: bytes holding 2 bits per move, 4 moves per byte (first move in the low bits) """
+    data = bytearray((len(moves) + 3) // 4)
+    for i, move in enumerate(moves):
+        data[i >> 2] |= MOVES.index(move) << ((i & 3) * 2)
+    return bytes(data)
+
+
+def unpackMoves(data, count):
+    """ Returns: the first count moves of packMoves output """
+    return "".join(MOVES[(data[i >> 2] >> ((i & 3) * 2)) & 3] for i in range(count))
+
+
+class MovePath:
+    # the boards of a solution, expanded from start + moves only as far as
+    # they are read, so results keep one string per path instead of one per
+    # step until something (the GUI stepping through) asks for a board
+    def __init__(self, start, moves):
+        self.start = start
+        self.moves = moves
+        self.boards = [start]
+        self.offsets = moveOffsets(math.isqrt(len(start)))
+
+    def __len__(self):
+        return len(self.moves) + 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("path index out of range")
+        while len(self.boards) <= i:
+            tiles = list(self.boards[-1])
+            blank = tiles.index("0")
+            pos = blank + self.offsets[MOVES.index(self.moves[len(self.boards) - 1])]
+            tiles[blank], tiles[pos] = tiles[pos], "0"
+            self.boards.append("".join(tiles))
+        return self.boards[i]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+
+class SolveResult:
+    # outcome of one solve_logic_* call; a solved result keeps start + moves
+    # and path expands them lazily
+    def __init__(self, start, status, path=None, seconds=0.0, steps=0, expanded=0, message="", moves=None):
+        self.start = start
+        # "solved", "no solution", "invalid input", "budget exceeded", "cancelled", "timed out"
+        # or (a search that raised, reported by the GUI and the batch tool) "error"
+        self.status = status
+        if moves is None and path:
+            moves = pathToMoves(path)
+        self.moves = moves if moves is not None else ""
+        # rejected input may not even be a string; keep it as a one-entry path
+        self.path = MovePath(start, self.moves) if isinstance(start, str) else [start]
+        self.seconds = seconds
+        self.steps = steps
+        self.expanded = expanded
+        self.message = message
+
+    def solved(self):
+        return self.status == "solved"
+
+
+class Board:
+    depth = 0
+    # when True, Sucssours checks every incremental h against a full recompute
+    verifyHurstic = False
+
+    def __init__(self, arg1=None, arg2=None, arg3=None, size=3):
+        if isinstance(arg1, str):
+            size = math.isqrt(len(arg1))
+        self.size = size
+        self.tables = slidingTables(size)
+        self.rows = [[0 for _ in range(size)] for _ in range(size)]
+        self.parent = None
+        self.depthObject = 0
+        self.h = None  # cached heuristic, filled incrementally by changeAsCopy
+
+        if isinstance(arg1, str):
+            num = arg1
+            idxPointer = 0
+            for i in range(size):
+                for j in range(size):
+                    c = num[idxPointer] + ""
+                    idxPointer += 1
+                    self.rows[i][j] = TILE_CHARS.index(c.upper())
+            self.parent = None
+            Board.depth = 0
+            self.depthObject = 0
+
+        elif isinstance(arg1, list) and isinstance(arg2, list) and isinstance(arg3, list):
+            self.rows[0] = arg1
+            self.rows[1] = arg2
+            self.rows[2] = arg3
+            self.parent = None
+            Board.depth = 0
+            self.depthObject = 0
+
+        else:
+            self.parent = None
+            Board.depth = 0
+            self.depthObject = 0
+
+    def print(self):
+        for j in range(self.size):
+            for i in range(self.size):
+                print(str(self.rows[j][i]) + " ", end="")
+            print()
+        print("-----")
+
+    def blankPos(self):
+        return self.Pos(0)
+
+    def Pos(self, n):
+        res = [0] * 2
+        for i in range(self.size):
+            for j in range(self.size):
+                if self.rows[i][j] == n:
+                    res[0] = i
+                    res[1] = j
+                    return res
+        return None
+
+    def adjElements(self):
+        # tiles next to the blank, read from the neighbor table
+        Blank = self.blankPos()
+        adj = []
+        for pos in self.tables.neighbors[Blank[0] * self.size + Blank[1]]:
+            adj.append(self.rows[pos // self.size][pos % self.size])
+        return adj
+
+    def calcHurstic(self):
+        # full recompute; the search itself updates h incrementally
+        manhattan = self.tables.manhattan
+        sum_val = 0
+        for i in range(self.size):
+            for j in range(self.size):
+                sum_val += manhattan[self.rows[i][j]][i * self.size + j]
+        return sum_val
+
+    def change(self, i, j, element):
+        self.rows[i][j] = element
+
+    def Copy(self, element):
+        b = Board(size=self.size)
+        for i in range(self.size):
+            for j in range(self.size):
+                b.change(i, j, self.rows[i][j])
+        return b
+
+    def changeAsCopy(self, element):
+        b = self.Copy(element)
+
+        posZero = self.blankPos()
+        posTarget = self.Pos(element)
+        b.change(posZero[0], posZero[1], element)
+        b.change(posTarget[0], posTarget[1], 0)
+        b.depthObject = self.depthObject
+        if self.h is not None:
+            # only the moved tile changes cell, so h changes by its delta
+            manhattan = self.tables.manhattan
+            b.h = (self.h - manhattan[element][posTarget[0] * self.size + posTarget[1]]
+                   + manhattan[element][posZero[0] * self.size + posZero[1]])
+        return b
+
+    def Sucssours(self, explored, frointer, algorithm, hurstic=None, hooks=None, weight=1.0):
+        adj = self.adjElements()
+        suc = [None] * len(adj)
+        for i in range(len(adj)):
+            tmp = self.changeAsCopy(adj[i])
+            tmp.parent = self
+            tmp.depthObject = self.depthObject + 1  # g: moves from the start board
+            suc[i] = tmp
+
+        for i in range(len(suc)):
+            # states already waiting in the frontier are handled by enqueue,
+            # which keeps the better priority instead of adding a duplicate
+            if not Board.dublicate(suc[i], explored):
+                h = suc[i].h
+                if h is None:
+                    h = suc[i].h = suc[i].calcHurstic()
+                elif Board.verifyHurstic and h != suc[i].calcHurstic():
+                    raise Exception("Incremental heuristic mismatch for " + suc[i].getBoardString())
+                if hurstic is not None:
+                    h = hurstic(suc[i].encode(), h, self.tables)
+                if algorithm.lower() == "a*":
+                    priority = h + suc[i].depthObject
+                elif algorithm.lower() == "weighted a*":
+                    priority = weight * h + suc[i].depthObject
+                elif algorithm.lower() == "greedy":
+                    priority = h
+                else:
+                    continue
+                pushed = frointer.enqueue(suc[i], priority, h)
+                if hooks is not None:
+                    hooks.onHeuristic(suc[i].encode(), h)
+                    if pushed:
+                        hooks.onPush(suc[i].encode(), priority)
+                    else:
+                        hooks.onDuplicate(suc[i].encode())
+            elif hooks is not None:
+                hooks.onDuplicate(suc[i].encode())
+
+    def encode(self):
+        # tables.bits per cell in row-major order, used as the hash key of the state
+        bits = self.tables.bits
+        code = 0
+        for i in range(self.size):
+            for j in range(self.size):
+                code = (code << bits) | self.rows[i][j]
+        return code
+
+    def getBoardString(self):
+        res = ""
+        for i in range(self.size):
+            for j in range(self.size):
+                res += TILE_CHARS[self.rows[i][j]]
+        return res
+
+    @staticmethod
+    def equal(b1, b2):
+        rows2 = b2.rows
+        rows1 = b1.rows
+        if len(rows1) != len(rows2):
+            return False
+        for i in range(len(rows1)):
+            for j in range(len(rows1)):
+                if rows1[i][j] != rows2[i][j]:
+                    return False
+        return True
+
+    # explored holds the encode() keys of expanded boards, so the check
+    # is a single hash lookup no matter how large the search grows
+    @staticmethod
+    def dublicate(b, explored):
+        return b.encode() in explored
+
+
+class PackedBoard:
+    # compact alternative to Board: the whole grid is one packed int
+    # (same layout as Board.encode) plus the blank index and a reference to
+    # the shared tables of its size, so a successor costs one small object
+    # instead of a list per row
+    __slots__ = ("state", "blank", "parent", "depthObject", "h", "tables")
+
+    # when True, Sucssours checks every incremental h against a full recompute
+    verifyHurstic = False
+
+    def __init__(self, num=None, state=0, blank=0, h=None, tables=None):
+        if isinstance(num, str):
+            tables = slidingTables(math.isqrt(len(num)))
+            state = 0
+            for pos in range(tables.cells):
+                tile = TILE_CHARS.index(num[pos].upper())
+                state = (state << tables.bits) | tile
+                if tile == 0:
+                    blank = pos
+        self.tables = tables if tables is not None else slidingTables(3)
+        self.state = state
+        self.blank = blank
+        self.parent = None
+        self.depthObject = 0
+        self.h = h if h is not None else self.calcHurstic()
+
+    def tileAt(self, pos):
+        return (self.state >> self.tables.shifts[pos]) & self.tables.mask
+
+    def print(self):
+        size = self.tables.size
+        for i in range(size):
+            for j in range(size):
+                print(str(self.tileAt(i * size + j)) + " ", end="")
+            print()
+        print("-----")
+
+    def calcHurstic(self):
+        # full recompute; successors get h incrementally in moveFrom
+        tables = self.tables
+        sum_val = 0
+        state = self.state
+        for pos in range(tables.cells - 1, -1, -1):
+            sum_val += tables.manhattan[state & tables.mask][pos]
+            state >>= tables.bits
+        return sum_val
+
+    def moveFrom(self, pos):
+        # slide the tile at pos into the blank
+        tables = self.tables
+        tile = (self.state >> tables.shifts[pos]) & tables.mask
+        state = self.state - (tile << tables.shifts[pos]) + (tile << tables.shifts[self.blank])
+        h = self.h - tables.manhattan[tile][pos] + tables.manhattan[tile][self.blank]
+        return PackedBoard(state=state, blank=pos, h=h, tables=tables)
+
+    def Sucssours(self, explored, frointer, algorithm, hurstic=None, hooks=None, weight=1.0):
+        for pos in self.tables.neighbors[self.blank]:
+            tmp = self.moveFrom(pos)
+            tmp.parent = self
+            tmp.depthObject = self.depthObject + 1  # g: moves from the start board
+
+            if tmp.state not in explored:
+                h = tmp.h
+                if PackedBoard.verifyHurstic and h != tmp.calcHurstic():
+                    raise Exception("Incremental heuristic mismatch for " + tmp.getBoardString())
+                if hurstic is not None:
+                    h = hurstic(tmp.state, h, self.tables)
+                if algorithm.lower() == "a*":
+                    priority = h + tmp.depthObject
+                elif algorithm.lower() == "weighted a*":
+                    priority = weight * h + tmp.depthObject
+                elif algorithm.lower() == "greedy":
+                    priority = h
+                else:
+                    continue
+                pushed = frointer.enqueue(tmp, priority, h)
+                if hooks is not None:
+                    hooks.onHeuristic(tmp.state, h)
+                    if pushed:
+                        hooks.onPush(tmp.state, priority)
+                    else:
+                        hooks.onDuplicate(tmp.state)
+            elif hooks is not None:
+                hooks.onDuplicate(tmp.state)
+
+    def encode(self):
+        return self.state
+
+    def getBoardString(self):
+        res = ""
+        for pos in range(self.tables.cells):
+            res += TILE_CHARS[self.tileAt(pos)]
+        return res
+
+
+# ---- extra admissible heuristics (all take the packed state int) ----
+
+def linePenalty(line, tiles, isRow, size):
+    # 2 moves for every tile that has to leave the line so the others can
+    # pass each other: tiles in the line minus the longest run already in
+    # goal order (Manhattan + this stays admissible)
+    goals = []
+    for tile in tiles:
+        if tile == 0:
+            continue
+        goalRow, goalCol = (tile - 1) // size, (tile - 1) % size
+        if isRow and goalRow == line:
+            goals.append(goalCol)
+        elif not isRow and goalCol == line:
+            goals.append(goalRow)
+
+    longest = [1] * len(goals)
+    for i in range(len(goals)):
+        for j in range(i):
+            if goals[j] < goals[i] and longest[j] + 1 > longest[i]:
+                longest[i] = longest[j] + 1
+    return 2 * (len(goals) - max(longest, default=0))
+
+
+def linearConflict(state, tables):
+    size = tables.size
+    cells = [0] * tables.cells
+    for pos in range(tables.cells - 1, -1, -1):
+        cells[pos] = state & tables.mask
+        state >>= tables.bits
+
+    # lines 0..size-1 are rows, size..2*size-1 are columns
+    cache = tables.lineConflicts
+    sum_val = 0
+    for k in range(size):
+        for line, tiles in ((k, tuple(cells[k * size:(k + 1) * size])),
+                            (size + k, tuple(cells[k::size]))):
+            key = (line, tiles)
+            penalty = cache.get(key)
+            if penalty is None:
+                penalty = cache[key] = linePenalty(k, tiles, line < size, size)
+            sum_val += penalty
+    return sum_val
+
+
+def manhattanLinearConflict(state, h, tables):
+    # h is the (incrementally maintained) Manhattan distance of the state
+    return h + linearConflict(state, tables)
+
+
+PDB_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "eight_puzzle_pdb.bin")
+PDB_PATTERNS = ((1, 2, 3, 4), (5, 6, 7, 8))
+
+
+class PatternDatabase:
+    # additive disjoint pattern database for the 3x3 board: one table per
+    # tile group, holding the fewest moves of that group's tiles needed to
+    # put them home.
+    # File layout: b"8PDB", pattern count, then per pattern its 4 tiles and
+    # 9**4 distance bytes indexed by the tiles' cells (255 = unused slot)
+    loaded = None
+
+    def __init__(self, filename=PDB_FILE):
+        if not os.path.exists(filename):
+            PatternDatabase.generate(filename)
+        self.file = open(filename, "rb")
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.data[:4] != b"8PDB":
+            raise Exception("Not a pattern database file: " + filename)
+
+        self.patterns = []
+        offset = 5
+        for _ in range(self.data[4]):
+            tiles = tuple(self.data[offset:offset + 4])
+            self.patterns.append((tiles, offset + 4))
+            offset += 4 + 9 ** 4
+
+    @staticmethod
+    def load(filename=PDB_FILE):
+        # shared instance, so the file is mapped once per process
+        if PatternDatabase.loaded is None:
+            PatternDatabase.loaded = PatternDatabase(filename)
+        return PatternDatabase.loaded
+
+    @staticmethod
+    def buildTable(tiles):
+        # backward 0-1 BFS from the goal over (pattern tile cells, blank cell);
+        # moving a pattern tile costs 1, any other tile is free
+        neighbors = slidingTables(3).neighbors
+        goal = tuple(tile - 1 for tile in tiles) + (8,)
+        dist = {goal: 0}
+        queue = deque([goal])
+        while queue:
+            cur = queue.popleft()
+            d = dist[cur]
+            blank = cur[-1]
+            for pos in neighbors[blank]:
+                nxt = list(cur)
+                cost = 0
+                if pos in cur[:-1]:
+                    nxt[cur.index(pos)] = blank
+                    cost = 1
+                nxt[-1] = pos
+                nxt = tuple(nxt)
+                if nxt not in dist or d + cost < dist[nxt]:
+                    dist[nxt] = d + cost
+                    if cost == 0:
+                        queue.appendleft(nxt)
+                    else:
+                        queue.append(nxt)
+
+        table = bytearray([255]) * 9 ** 4
+        for key, d in dist.items():
+            idx = ((key[0] * 9 + key[1]) * 9 + key[2]) * 9 + key[3]
+            if d < table[idx]:
+                table[idx] = d
+        return table
+
+    @staticmethod
+    def generate(filename=PDB_FILE):
+        out = bytearray(b"8PDB")
+        out.append(len(PDB_PATTERNS))
+        for tiles in PDB_PATTERNS:
+            out += bytes(tiles)
+            out += PatternDatabase.buildTable(tiles)
+        with open(filename, "wb") as f:
+            f.write(out)
+
+    def lookup(self, state, h=None, tables=None):
+        cells = [0] * 9
+        for pos in range(8, -1, -1):
+            cells[state & 0xF] = pos
+            state >>= 4
+        data = self.data
+        sum_val = 0
+        for tiles, offset in self.patterns:
+            sum_val += data[offset + ((cells[tiles[0]] * 9 + cells[tiles[1]]) * 9 + cells[tiles[2]]) * 9 + cells[tiles[3]]]
+        return sum_val
+
+
+DISTANCE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "eight_puzzle_distances.bin")
+FACTORIALS = (40320, 5040, 720, 120, 24, 6, 2, 1, 1)
+
+
+def permutationRank(tiles):
+    # Lehmer code of a 3x3 board: a unique index in 0 .. 9! - 1
+    rank = 0
+    for i in range(9):
+        smaller = 0
+        for j in range(i + 1, 9):
+            if tiles[j] < tiles[i]:
+                smaller += 1
+        rank += smaller * FACTORIALS[i]
+    return rank
+
+
+class DistanceTable:
+    # exact distance to the goal for every 3x3 board, from one BFS out of the
+    # goal. File layout: b"8DST" then one byte per permutation rank: the low
+    # 5 bits are the distance (at most 31), the top bits the best blank move
+    # (0 up, 1 left, 2 down, 3 right); 255 marks an unreachable permutation
+    loaded = None
+    DELTAS = (-3, -1, 3, 1)
+
+    def __init__(self, filename=DISTANCE_FILE):
+        if not os.path.exists(filename):
+            DistanceTable.generate(filename)
+        self.file = open(filename, "rb")
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.data[:4] != b"8DST":
+            raise Exception("Not a distance table file: " + filename)
+
+    @staticmethod
+    def load(filename=DISTANCE_FILE):
+        # shared instance, so the file is mapped once per process
+        if DistanceTable.loaded is None:
+            DistanceTable.loaded = DistanceTable(filename)
+        return DistanceTable.loaded
+
+    @staticmethod
+    def generate(filename=DISTANCE_FILE):
+        neighbors = slidingTables(3).neighbors
+        table = bytearray([255]) * FACTORIALS[0] * 9
+        goal = parseTiles(slidingTables(3).goal)
+        table[permutationRank(goal)] = 0
+        queue = deque([(goal, 8, 0)])
+        while queue:
+            tiles, blank, d = queue.popleft()
+            for pos in neighbors[blank]:
+                child = tiles[:]
+                child[blank] = child[pos]
+                child[pos] = 0
+                rank = permutationRank(child)
+                if table[rank] == 255:
+                    # from the child, moving the blank back to `blank` is optimal
+                    table[rank] = (DistanceTable.DELTAS.index(blank - pos) << 5) | (d + 1)
+                    queue.append((child, pos, d + 1))
+        with open(filename, "wb") as f:
+            f.write(b"8DST" + table)
+
+    def lookup(self, num):
+        # optimal number of moves, or None if the board is unsolvable
+        entry = self.data[4 + permutationRank(parseTiles(num))]
+        if entry == 255:
+            return None
+        return entry & 31
+
+    def walk(self, num):
+        # optimal path (list of board strings) by following the best moves
+        tiles = parseTiles(num)
+        blank = tiles.index(0)
+        path = [num]
+        entry = self.data[4 + permutationRank(tiles)]
+        if entry == 255:
+            return None
+        while entry & 31 != 0:
+            pos = blank + DistanceTable.DELTAS[entry >> 5]
+            tiles[blank] = tiles[pos]
+            tiles[pos] = 0
+            blank = pos
+            path.append("".join(TILE_CHARS[t] for t in tiles))
+            entry = self.data[4 + permutationRank(tiles)]
+        return path
+
+
+class SearchHooks:
+    # instrumentation interface for Solver(hooks=...). Every callback gets
+    # the packed state (Board.encode / PackedBoard.state layout); override
+    # the ones you need. With hooks=None the search only pays one
+    # `is not None` test per event
+    def onExpand(self, state):
+        pass
+
+    def onPush(self, state, priority):
+        # a board entered the frontier, or improved its priority in it
+        pass
+
+    def onPop(self, state):
+        pass
+
+    def onDuplicate(self, state):
+        # a successor that was already expanded or already queued as good
+        pass
+
+    def onHeuristic(self, state, h):
+        pass
+
+    def onFrontier(self, size):
+        # boards waiting in the frontier right now, reported after each
+        # expansion (layer by layer in the breadth-first modes); unlike
+        # pushes minus pops this is the real queue length
+        pass
+
+    def onSolution(self, path, weight):
+        # anytime search found a better path (list of board strings); it is
+        # at most `weight` times longer than optimal
+        pass
+
+
+class SearchCounters(SearchHooks):
+    # counts every event; onProgress(counters) is called every `every`
+    # expansions so a GUI can redraw live charts while the search runs
+    def __init__(self, onProgress=None, every=1000):
+        self.expanded = 0
+        self.pushed = 0
+        self.popped = 0
+        self.duplicates = 0
+        self.heuristicEvaluations = 0
+        self.frontier = 0  # last size reported by onFrontier
+        self.onProgress = onProgress
+        self.every = every
+
+    def onExpand(self, state):
+        self.expanded += 1
+        if self.onProgress is not None and self.expanded % self.every == 0:
+            self.onProgress(self)
+
+    def onPush(self, state, priority):
+        self.pushed += 1
+
+    def onPop(self, state):
+        self.popped += 1
+
+    def onDuplicate(self, state):
+        self.duplicates += 1
+
+    def onHeuristic(self, state, h):
+        self.heuristicEvaluations += 1
+
+    def onFrontier(self, size):
+        self.frontier = size
+
+    def counts(self):
+        return {"expanded": self.expanded, "pushed": self.pushed, "popped": self.popped,
+                "duplicates": self.duplicates, "heuristicEvaluations": self.heuristicEvaluations,
+                "frontier": self.frontier}
+
+
+class Solver:
+    def __init__(self, maxNodes=None, maxStates=None, boardType=None, heuristic="manhattan", hooks=None, weight=2.0):
+        self.steps = 0
+        self.timeTaken = 0
+        self.solution = []
+        # search budget: maxNodes caps expansions, maxStates caps the boards
+        # kept in memory (explored + frontier). None means no limit
+        self.maxNodes = maxNodes
+        self.maxStates = maxStates
+        self.expanded = 0
+        # largest number of boards waiting to be expanded at any one time
+        self.peakFrontier = 0
+        self.status = ""
+        # state representation used by the search (Board or PackedBoard)
+        self.boardType = boardType if boardType is not None else PackedBoard
+        # "manhattan", "linear conflict" or "pdb"
+        self.heuristic = heuristic
+        # SearchHooks instance notified of every search event, or None
+        self.hooks = hooks
+        # weighted A* orders the frontier by depth + weight * h: 1.0 is A*,
+        # larger trades solution length for fewer expansions
+        self.weight = weight
+
+    def overBudget(self, explored, frontier):
+        if self.maxNodes is not None and self.expanded >= self.maxNodes:
+            return True
+        if self.maxStates is not None and len(explored) + frontier.size() >= self.maxStates:
+            return True
+        return False
+
+    def hursticFunction(self, size):
+        # None keeps the incremental Manhattan distance from Sucssours
+        name = self.heuristic.lower()
+        if name == "manhattan":
+            return None
+        elif name == "linear conflict":
+            return manhattanLinearConflict
+        elif name == "pdb":
+            if size != 3:
+                raise Exception("The pattern database only covers the 3x3 board")
+            return PatternDatabase.load().lookup
+        raise Exception("Unknown heuristic: " + self.heuristic)
+
+    def search(self, num, algorithm):
+        startTime = time.time_ns()
+        hurstic = self.hursticFunction(math.isqrt(len(num)))
+        hooks = self.hooks
+        frontier = PriorityQueue(key=self.boardType.encode)
+        b = self.boardType(num)
+        b.h = b.calcHurstic()
+        explored = set()
+        self.solution = []
+        self.path = []
+        self.steps = 0
+        self.expanded = 0
+        self.peakFrontier = 0
+        self.status = "solved"
+        if not isSolvable(num):
+            self.status = "no solution"
+
+        while self.status == "solved" and b.h != 0:
+            if self.overBudget(explored, frontier):
+                self.status = "budget exceeded"
+                break
+            explored.add(b.encode())
+            self.expanded += 1
+            if hooks is not None:
+                hooks.onExpand(b.encode())
+            b.Sucssours(explored, frontier, algorithm, hurstic, hooks, self.weight)
+            if frontier.size() > self.peakFrontier:
+                self.peakFrontier = frontier.size()
+            if hooks is not None:
+                hooks.onFrontier(frontier.size())
+            if frontier.isEmpty():
+                self.status = "no solution"
+                break
+            b = frontier.dequeue()
+            if hooks is not None:
+                hooks.onPop(b.encode())
+
+        if self.status == "solved":
+            sol = []
+            while b is not None:
+                sol.append(b)
+                b = b.parent
+            sol.reverse()
+            self.solution = sol
+            self.path = [b.getBoardString() for b in sol]
+            self.steps = len(sol) - 1
+
+        endTime = time.time_ns()
+        self.timeTaken = endTime - startTime
+
+    def SolveByGreedy(self, num):
+        self.search(num, "Greedy")
+
+    def SolveByAstar(self, num):
+        self.search(num, "A*")
+
+    def SolveByWeightedAstar(self, num, weight=None):
+        if weight is not None:
+            self.weight = weight
+        self.search(num, "Weighted A*")
+
+    def improveByARAstar(self, num, timeLimit=None, startWeight=3.0, step=0.5):
+        # anytime repairing A*: weighted A* passes with a shrinking weight,
+        # each pass reusing the g values of the last one (boards whose g
+        # dropped after they were closed wait in incons for the next pass).
+        # Yields (weight, path) whenever a shorter path is found; the pass
+        # with weight 1.0 proves the last path optimal. Stops early when
+        # timeLimit seconds or maxNodes run out: status then says why
+        # ("timed out" / "budget exceeded") and path keeps the best path so
+        # far, which is not proven optimal
+        startTime = time.time_ns()
+        deadline = None if timeLimit is None else time.monotonic() + timeLimit
+        tables = slidingTables(math.isqrt(len(num)))
+        neighbors = tables.neighbors
+        shifts = tables.shifts
+        mask = tables.mask
+        manhattan = tables.manhattan
+        hurstic = self.hursticFunction(tables.size)
+        hooks = self.hooks
+        start = PackedBoard(num)
+        goal = PackedBoard(tables.goal).state
+
+        self.solution = []
+        self.path = []
+        self.steps = 0
+        self.expanded = 0
+        self.peakFrontier = 0
+        self.improvements = []  # (weight, steps, seconds) per better path found
+        self.status = "budget exceeded"
+        if not isSolvable(num):
+            self.status = "no solution"
+            self.timeTaken = time.time_ns() - startTime
+            return
+
+        g = {start.state: 0}
+        parent = {start.state: None}
+        # state -> (blank, manhattan, heuristic)
+        nodes = {start.state: (start.blank, start.h, start.h if hurstic is None else hurstic(start.state, start.h, tables))}
+        weight = max(1.0, startWeight)
+        frontier = [(weight * nodes[start.state][2], 0, start.state)]  # stale entries are skipped on pop
+        counter = 1
+        closed = set()
+        incons = set()
+        stopped = None  # why the search gave up early, if it did
+
+        while not stopped:
+            while frontier and frontier[0][0] < g.get(goal, math.inf):
+                f, _, state = heapq.heappop(frontier)
+                if state in closed or f != g[state] + weight * nodes[state][2]:
+                    continue
+                if self.maxNodes is not None and self.expanded >= self.maxNodes:
+                    stopped = "budget exceeded"
+                    break
+                if deadline is not None and self.expanded % 256 == 0 and time.monotonic() > deadline:
+                    stopped = "timed out"
+                    break
+                closed.add(state)
+                self.expanded += 1
+                if hooks is not None:
+                    hooks.onPop(state)
+                    hooks.onExpand(state)
+                blank, m, _ = nodes[state]
+                depth = g[state] + 1
+                for pos in neighbors[blank]:
+                    tile = (state >> shifts[pos]) & mask
+                    child = state - (tile << shifts[pos]) + (tile << shifts[blank])
+                    if depth >= g.get(child, math.inf):
+                        if hooks is not None:
+                            hooks.onDuplicate(child)
+                        continue
+                    g[child] = depth
+                    parent[child] = state
+                    if child not in nodes:
+                        cm = m - manhattan[tile][pos] + manhattan[tile][blank]
+                        nodes[child] = (pos, cm, cm if hurstic is None else hurstic(child, cm, tables))
+                        if hooks is not None:
+                            hooks.onHeuristic(child, nodes[child][2])
+                    if child in closed:
+                        incons.add(child)
+                    else:
+                        f = depth + weight * nodes[child][2]
+                        heapq.heappush(frontier, (f, counter, child))
+                        counter += 1
+                        if hooks is not None:
+                            hooks.onPush(child, f)
+                if len(frontier) > self.peakFrontier:
+                    self.peakFrontier = len(frontier)
+                if hooks is not None:
+                    hooks.onFrontier(len(frontier))
+
+            if goal in g and (not self.path or g[goal] < self.steps):
+                states = []
+                state = goal
+                while state is not None:
+                    states.append(state)
+                    state = parent[state]
+                states.reverse()
+                self.path = [PackedBoard(state=state, tables=tables).getBoardString() for state in states]
+                self.steps = len(states) - 1
+                self.status = "solved"
+                self.timeTaken = time.time_ns() - startTime
+                self.improvements.append((weight, self.steps, self.timeTaken * 10**-9))
+                if hooks is not None:
+                    hooks.onSolution(self.path, weight)
+                yield weight, list(self.path)
+            if stopped or weight == 1.0 or not frontier and not incons:
+                break
+
+            # next pass: smaller weight, incons back in the frontier, every
+            # key recomputed for the new weight, nothing closed yet
+            weight = max(1.0, weight - step)
+            waiting = {entry[2] for entry in frontier if entry[2] not in closed} | incons
+            frontier = []
+            for state in waiting:
+                frontier.append((g[state] + weight * nodes[state][2], counter, state))
+                counter += 1
+            heapq.heapify(frontier)
+            closed = set()
+            incons = set()
+            if hooks is not None:
+                hooks.onFrontier(len(frontier))
+
+        if stopped is not None:
+            self.status = stopped
+        self.solution = [self.boardType(s) for s in self.path]
+        self.timeTaken = time.time_ns() - startTime
+
+    def SolveByARAstar(self, num, timeLimit=None, startWeight=3.0, step=0.5):
+        for _ in self.improveByARAstar(num, timeLimit, startWeight, step):
+            pass
+
+    def SolveByIDAstar(self, num):
+        # iterative deepening A*: depth-first passes bounded by f = g + h,
+        # moving tiles in place on one list and undoing them on the way back,
+        # so memory is O(depth) and 4x4 boards ("123456789ABCDEF0") fit too
+        startTime = time.time_ns()
+        tiles = parseTiles(num)
+        tables = slidingTables(math.isqrt(len(tiles)))
+        neighbors = tables.neighbors
+        manhattan = tables.manhattan
+        hooks = self.hooks
+        blank = tiles.index(0)
+        h = 0
+        for pos in range(len(tiles)):
+            h += manhattan[tiles[pos]][pos]
+
+        self.solution = []
+        self.path = []
+        self.steps = 0
+        self.expanded = 0
+        self.iterations = 0
+        self.nodesPerThreshold = []  # (threshold, nodes expanded in that pass)
+        self.peakFrontier = 0  # deepest move stack, IDA* keeps no frontier
+        self.status = "solved"
+
+        moves = []  # cell the blank moved to, one entry per step
+        FOUND = -1
+
+        def packed():
+            # hooks only: the current board in the packed layout
+            code = 0
+            for t in tiles:
+                code = (code << tables.bits) | t
+            return code
+
+        def dfs(blank, g, h, previous):
+            f = g + h
+            if hooks is not None:
+                state = packed()
+                if g > 0:
+                    hooks.onPush(state, g)
+                hooks.onHeuristic(state, h)
+            if f > threshold:
+                return f
+            if h == 0:
+                return FOUND
+            if self.maxNodes is not None and self.expanded >= self.maxNodes:
+                return None
+
+            self.expanded += 1
+            nodes[0] += 1
+            if hooks is not None:
+                hooks.onExpand(packed())
+            nextThreshold = math.inf
+            for pos in neighbors[blank]:
+                if pos == previous:  # never undo the move we just made
+                    if hooks is not None:
+                        hooks.onDuplicate(packed())
+                    continue
+                tile = tiles[pos]
+                tiles[blank] = tile
+                tiles[pos] = 0
+                moves.append(pos)
+                if len(moves) > self.peakFrontier:
+                    self.peakFrontier = len(moves)
+                t = dfs(pos, g + 1, h - manhattan[tile][pos] + manhattan[tile][blank], blank)
+                if t == FOUND:
+                    return FOUND
+                if hooks is not None:
+                    hooks.onPop(packed())
+                moves.pop()
+                tiles[pos] = tile
+                tiles[blank] = 0
+                if t is None:
+                    return None
+                if t < nextThreshold:
+                    nextThreshold = t
+            return nextThreshold
+
+        threshold = h
+        if not isSolvable(num):
+            self.status = "no solution"
+        while self.status == "solved":
+            self.iterations += 1
+            nodes = [0]
+            t = dfs(blank, 0, h, -1)
+            self.nodesPerThreshold.append((threshold, nodes[0]))
+            if t == FOUND:
+                break
+            if t is None:
+                self.status = "budget exceeded"
+                break
+            if t == math.inf:
+                self.status = "no solution"
+                break
+            threshold = t
+
+        if self.status == "solved":
+            # replay the moves on the start board to rebuild the path
+            tiles = parseTiles(num)
+            self.path = ["".join(TILE_CHARS[t] for t in tiles)]
+            for pos in moves:
+                tiles[blank], tiles[pos] = tiles[pos], 0
+                blank = pos
+                self.path.append("".join(TILE_CHARS[t] for t in tiles))
+            self.solution = [self.boardType(s) for s in self.path]
+            self.steps = len(moves)
+
+        endTime = time.time_ns()
+        self.timeTaken = endTime - startTime
+
+    def SolveByBidirectional(self, num):
+        # bidirectional BFS: grow one full layer at a time from whichever of
+        # the start / goal frontiers is smaller, until a new state is already
+        # known to the other side. Both sides map packed state -> parent, and
+        # since no earlier pair of layers touched, the first meeting is optimal
+        startTime = time.time_ns()
+        tables = slidingTables(math.isqrt(len(num)))
+        neighbors = tables.neighbors
+        shifts = tables.shifts
+        mask = tables.mask
+        hooks = self.hooks
+        start = PackedBoard(num)
+        goal = PackedBoard(tables.goal)
+
+        self.solution = []
+        self.path = []
+        self.steps = 0
+        self.expanded = 0
+        self.meetingDepth = 0
+        self.frontierSizes = (1, 1)
+        self.peakFrontier = 2
+        self.status = "solved"
+
+        parents = [{start.state: None}, {goal.state: None}]
+        frontiers = [[(start.state, start.blank)], [(goal.state, goal.blank)]]
+        meet = start.state if start.state == goal.state else None
+        depths = [0, 0]  # layers grown on each side, the priority reported to hooks
+        if not isSolvable(num):
+            self.status = "no solution"
+
+        while self.status == "solved" and meet is None:
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            mine = parents[side]
+            other = parents[1 - side]
+            depths[side] += 1
+            layer = []
+            for state, blank in frontiers[side]:
+                if self.maxNodes is not None and self.expanded >= self.maxNodes:
+                    self.status = "budget exceeded"
+                    break
+                if self.maxStates is not None and len(mine) + len(other) >= self.maxStates:
+                    self.status = "budget exceeded"
+                    break
+                self.expanded += 1
+                if hooks is not None:
+                    hooks.onPop(state)
+                    hooks.onExpand(state)
+                for pos in neighbors[blank]:
+                    tile = (state >> shifts[pos]) & mask
+                    child = state - (tile << shifts[pos]) + (tile << shifts[blank])
+                    if child in mine:
+                        if hooks is not None:
+                            hooks.onDuplicate(child)
+                        continue
+                    mine[child] = state
+                    layer.append((child, pos))
+                    if hooks is not None:
+                        hooks.onPush(child, depths[side])
+                    if child in other:
+                        meet = child
+                        break
+                if meet is not None:
+                    break
+            frontiers[side] = layer
+            if len(frontiers[0]) + len(frontiers[1]) > self.peakFrontier:
+                self.peakFrontier = len(frontiers[0]) + len(frontiers[1])
+            if hooks is not None:
+                hooks.onFrontier(len(frontiers[0]) + len(frontiers[1]))
+            if self.status == "solved" and meet is None and not layer:
+                self.status = "no solution"
+        self.frontierSizes = (len(frontiers[0]), len(frontiers[1]))
+
+        if self.status == "solved":
+            # start -> meet from the forward parents, meet -> goal from the backward ones
+            states = []
+            state = meet
+            while state is not None:
+                states.append(state)
+                state = parents[0][state]
+            states.reverse()
+            self.meetingDepth = len(states) - 1
+            state = parents[1][meet]
+            while state is not None:
+                states.append(state)
+                state = parents[1][state]
+
+            for state in states:
+                self.path.append(PackedBoard(state=state, tables=tables).getBoardString())
+            self.solution = [self.boardType(s) for s in self.path]
+            self.steps = len(self.path) - 1
+
+        endTime = time.time_ns()
+        self.timeTaken = endTime - startTime
+
+    def SolveByTable(self, num):
+        # optimal answer by walking the precomputed 3x3 distance table
+        startTime = time.time_ns()
+        if math.isqrt(len(num)) != 3:
+            raise Exception("The distance table only covers the 3x3 board")
+        self.solution = []
+        self.path = []
+        self.steps = 0
+        self.expanded = 0
+        self.peakFrontier = 0
+        self.status = "solved"
+
+        path = DistanceTable.load().walk(num)
+        if path is None:
+            self.status = "no solution"
+        else:
+            self.path = path
+            self.solution = [self.boardType(s) for s in path]
+            self.steps = len(path) - 1
+
+        endTime = time.time_ns()
+        self.timeTaken = endTime - startTime
+
+    def SolveByBFS(self, num):
+        # plain breadth-first search without any heuristic: slow, but optimal
+        # by construction, so it is the reference for verify_optimality
+        startTime = time.time_ns()
+        tables = slidingTables(math.isqrt(len(num)))
+        neighbors = tables.neighbors
+        shifts = tables.shifts
+        mask = tables.mask
+        hooks = self.hooks
+        start = PackedBoard(num)
+        goal = PackedBoard(tables.goal).state
+
+        self.solution = []
+        self.path = []
+        self.steps = 0
+        self.expanded = 0
+        self.peakFrontier = 1
+        self.status = "solved"
+
+        parents = {start.state: None}
+        layer = [(start.state, start.blank)]
+        found = start.state == goal
+        depth = 0  # layers grown so far, the priority reported to hooks
+        if not isSolvable(num):
+            self.status = "no solution"
+
+        while self.status == "solved" and not found:
+            depth += 1
+            nextLayer = []
+            for state, blank in layer:
+                if self.maxNodes is not None and self.expanded >= self.maxNodes:
+                    self.status = "budget exceeded"
+                    break
+                if self.maxStates is not None and len(parents) >= self.maxStates:
+                    self.status = "budget exceeded"
+                    break
+                self.expanded += 1
+                if hooks is not None:
+                    hooks.onPop(state)
+                    hooks.onExpand(state)
+                for pos in neighbors[blank]:
+                    tile = (state >> shifts[pos]) & mask
+                    child = state - (tile << shifts[pos]) + (tile << shifts[blank])
+                    if child in parents:
+                        if hooks is not None:
+                            hooks.onDuplicate(child)
+                        continue
+                    parents[child] = state
+                    if hooks is not None:
+                        hooks.onPush(child, depth)
+                    if child == goal:
+                        found = True
+                        break
+                    nextLayer.append((child, pos))
+                if found:
+                    break
+            layer = nextLayer
+            if len(layer) > self.peakFrontier:
+                self.peakFrontier = len(layer)
+            if hooks is not None:
+                hooks.onFrontier(len(layer))
+            if self.status == "solved" and not found and not layer:
+                self.status = "no solution"
+
+        if self.status == "solved":
+            state = goal
+            while state is not None:
+                self.path.append(PackedBoard(state=state, tables=tables).getBoardString())
+                state = parents[state]
+            self.path.reverse()
+            self.solution = [self.boardType(s) for s in self.path]
+            self.steps = len(self.path) - 1
+
+        endTime = time.time_ns()
+        self.timeTaken = endTime - startTime
+
+    def checkAgainstTable(self, num, optimal):
+        # oracle check of the last solve: an optimal mode must match the
+        # table exactly, any other mode can only be longer by an even amount
+        if self.status != "solved" or math.isqrt(len(num)) != 3:
+            return
+        best = DistanceTable.load().lookup(num)
+        if optimal and self.steps != best:
+            raise Exception(num + ": solved in " + str(self.steps) + " steps, optimal is " + str(best))
+        if not optimal and (self.steps < best or (self.steps - best) % 2 != 0):
+            raise Exception(num + ": " + str(self.steps) + " steps is impossible, optimal is " + str(best))
+
+    def print(self):
+        for i in range(len(self.solution)):
+            self.solution[i].print()
+
+
+class SolutionCache:
+    # LRU of solutions (move strings) keyed on (mode, start board), at most
+    # maxEntries of them. For the optimal modes every board on a cached path
+    # is indexed too: the rest of an optimal path is an optimal path from
+    # that board, so those queries are answered without a search. With a
+    # filename the cache is loaded from there and written back by save()
+    OPTIMAL_MODES = ("a*", "ida*", "bidirectional", "table", "bfs")
+
+    def __init__(self, maxEntries=1000, filename=None):
+        self.maxEntries = maxEntries
+        self.filename = filename
+        self.entries = OrderedDict()  # (mode, start) -> moves, least recently used first
+        self.suffixes = {}  # (mode, board) -> (key of the entry whose path holds it, index in that path)
+        self.hits = 0
+        self.suffixHits = 0
+        self.misses = 0
+        self.lock = threading.Lock()  # the GUI solves on two threads at once
+        if filename is not None and os.path.exists(filename):
+            self.load(filename)
+
+    def get(self, mode, start):
+        """ Returns: the cached moves from start, or None """
+        with self.lock:
+            key = (mode, start)
+            moves = self.entries.get(key)
+            if moves is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return moves
+            found = self.suffixes.get(key)
+            if found is not None:
+                self.entries.move_to_end(found[0])
+                self.suffixHits += 1
+                return self.entries[found[0]][found[1]:]
+            self.misses += 1
+            return None
+
+    def put(self, mode, start, moves):
+        with self.lock:
+            key = (mode, start)
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                return
+            self.entries[key] = moves
+            if mode in SolutionCache.OPTIMAL_MODES:
+                path = MovePath(start, moves)
+                for i in range(1, len(path) - 1):
+                    # keep an older entry if it already covers this board
+                    self.suffixes.setdefault((mode, path[i]), (key, i))
+            while len(self.entries) > self.maxEntries:
+                self.evict()
+
+    def evict(self):
+        key, moves = self.entries.popitem(last=False)
+        if key[0] in SolutionCache.OPTIMAL_MODES:
+            for board in MovePath(key[1], moves)[1:-1]:
+                if self.suffixes.get((key[0], board), (None,))[0] == key:
+                    del self.suffixes[(key[0], board)]
+
+    def stats(self):
+        lookups = self.hits + self.suffixHits + self.misses
+        return {"entries": len(self.entries), "hits": self.hits, "suffixHits": self.suffixHits,
+                "misses": self.misses, "hitRate": (self.hits + self.suffixHits) / lookups if lookups else 0.0}
+
+    def load(self, filename):
+        with open(filename) as f:
+            data = json.load(f)
+        for mode, start, moves in data["entries"]:
+            self.put(mode, start, moves)
+
+    def save(self, filename=None):
+        filename = filename if filename is not None else self.filename
+        with self.lock:
+            data = {"entries": [[key[0], key[1], moves] for key, moves in self.entries.items()]}
+        # write a temporary file first so a crash never leaves half a cache behind
+        with open(filename + ".tmp", "w") as f:
+            json.dump(data, f)
+        os.replace(filename + ".tmp", filename)
+
+
+# shared by solve_logic_A / solve_logic_B
+solutionCache = SolutionCache()
+
+
+def run_solver(start_state, mode, max_nodes=None, oracle=False, hooks=None, cache=None, weight=2.0, time_limit=None,
+               heuristic="manhattan"):
+    """ Returns: SolveResult. Invalid and unsolvable boards are rejected before any search """
+    error = validateBoard(start_state)
+    if error is not None:
+        return SolveResult(start_state, "invalid input", message=error)
+    start_state = start_state.upper()
+    if not isSolvable(start_state):
+        return SolveResult(start_state, "no solution", message="This board cannot reach the goal (odd inversion parity).")
+    if mode == "table" and math.isqrt(len(start_state)) != 3:
+        return SolveResult(start_state, "invalid input", message="The distance table only covers the 3x3 board.")
+    if heuristic.lower() == "pdb" and math.isqrt(len(start_state)) != 3:
+        return SolveResult(start_state, "invalid input", message="The pattern database only covers the 3x3 board.")
+
+    # the weight changes the answer of the weighted modes and the heuristic
+    # can change any path, so both are part of the cache key (an ARA* run cut
+    # short never reports "solved", so its best-so-far path is not cached)
+    cacheMode = "%s w=%g" % (mode, weight) if mode in ("weighted a*", "ara*") else mode
+    if heuristic.lower() != "manhattan":
+        cacheMode += " h=" + heuristic.lower()
+
+    # the oracle checks a search, so it never takes an answer from the cache
+    if cache is not None and not oracle:
+        startTime = time.time_ns()
+        moves = cache.get(cacheMode, start_state)
+        if moves is not None:
+            return SolveResult(start_state, "solved", seconds=(time.time_ns() - startTime)*10**-9, steps=len(moves),
+                               message="from the solution cache", moves=moves)
+
+    s=Solver(maxNodes=max_nodes, hooks=hooks, weight=weight, heuristic=heuristic)
+    if mode == "greedy":
+        s.SolveByGreedy(start_state)
+    elif mode == "a*":
+        s.SolveByAstar(start_state)
+    elif mode == "weighted a*":
+        s.SolveByWeightedAstar(start_state)
+    elif mode == "ara*":
+        s.SolveByARAstar(start_state, time_limit)
+    elif mode == "ida*":
+        s.SolveByIDAstar(start_state)
+    elif mode == "bidirectional":
+        s.SolveByBidirectional(start_state)
+    elif mode == "table":
+        s.SolveByTable(start_state)
+    elif mode == "bfs":
+        s.SolveByBFS(start_state)
+    else:
+        raise Exception("Unknown solver mode: " + mode)
+    if oracle:
+        s.checkAgainstTable(start_state, optimal=(mode not in ("greedy", "weighted a*", "ara*")))
+    # an ARA* run that stopped early still hands back its best path
+    moves = pathToMoves(s.path) if s.path else ""
+    if cache is not None and s.status == "solved":
+        cache.put(cacheMode, start_state, moves)
+
+    message = "" if s.status == "solved" or not moves else "Best path before the search stopped, not proven optimal."
+    return SolveResult(start_state, s.status, seconds=s.timeTaken*10**-9, steps=s.steps, expanded=s.expanded,
+                       message=message, moves=moves)
+
+def solve_logic_A(start_state, max_nodes=None, oracle=False, cache=solutionCache):
+    return run_solver(start_state, "greedy", max_nodes, oracle, cache=cache)
+
+def solve_logic_B(start_state, max_nodes=None, oracle=False, cache=solutionCache):
+    return run_solver(start_state, "a*", max_nodes, oracle, cache=cache)
+
+def solve_logic_IDA(start_state, max_nodes=None):
+    return run_solver(start_state, "ida*", max_nodes)
+
+def solve_logic_bidirectional(start_state, max_nodes=None):
+    return run_solver(start_state, "bidirectional", max_nodes)
+
+def solve_logic_table(start_state):
+    return run_solver(start_state, "table")
+
+def verify_optimality(start_states, modes=("a*", "ara*", "ida*", "bidirectional"), heuristic="manhattan"):
+    """ Solves every board with BFS and with each optimal mode. Returns: [(board, mode, steps, BFS steps)] for every mismatch """
+    solveBy = {"a*": "SolveByAstar", "ara*": "SolveByARAstar", "ida*": "SolveByIDAstar",
+               "bidirectional": "SolveByBidirectional", "table": "SolveByTable"}
+    mismatches = []
+    for num in start_states:
+        num = num.upper()
+        reference = Solver()
+        reference.SolveByBFS(num)
+        for mode in modes:
+            for boardType in ((PackedBoard, Board) if mode == "a*" else (PackedBoard,)):
+                s = Solver(boardType=boardType, heuristic=heuristic)
+                getattr(s, solveBy[mode])(num)
+                if s.status != reference.status or s.steps != reference.steps:
+                    mismatches.append((num, mode, s.steps if s.status == "solved" else s.status,
+                                       reference.steps if reference.status == "solved" else reference.status))
+    return mismatches
+
+def heuristic_report(start_state, heuristics=("manhattan", "linear conflict", "pdb")):
+    """ Runs A* once per heuristic. Returns: {heuristic: (steps, expanded nodes, time)} """
+    report = {}
+    for name in heuristics:
+        s=Solver(heuristic=name)
+        s.SolveByAstar(start_state)
+        report[name] = (s.steps if s.status == "solved" else s.status, s.expanded, s.timeTaken*10**-9)
+    return report
+
+
+class SearchStopped(Exception):
+    pass
+
+
+class SearchMonitor(SearchCounters):
+    # progress and cancellation for one background search: the worker thread
+    # updates the counters, the Tk thread only reads them and sets `cancelled`
+    def __init__(self, timeout=None):
+        SearchCounters.__init__(self)
+        self.cancelled = threading.Event()
+        self.started = time.monotonic()
+        self.deadline = None if timeout is None else self.started + timeout
+        self.latestPath = None  # best path so far from an anytime search
+
+    def onExpand(self, state):
+        SearchCounters.onExpand(self, state)
+        if self.cancelled.is_set():
+            raise SearchStopped("cancelled")
+        if self.deadline is not None and self.expanded % 256 == 0 and time.monotonic() > self.deadline:
+            raise SearchStopped("timed out")
+
+    def onSolution(self, path, weight):
+        self.latestPath = path
+
+    def frontierSize(self):
+        # as last reported by the search (0 for IDA*, which keeps no frontier)
+        return self.frontier
+
+    def seconds(self):
+        return time.monotonic() - self.started
@@ -1,334 +1,11 @@
 import tkinter as tk
 from tkinter import messagebox
-import time
 import math
+import queue
+import threading
 
-# ==========================================
-# LOGIC SECTION (Unchanged)
-# ==========================================
-
-class Node:
-    def __init__(self, data, priority):
-        self.data = data
-        self.priority = priority
-        self.next = None
-
-class PriorityQueue:
-    def __init__(self):
-        self.head = None
-
-    def enqueue(self, data, priority):
-        newNode = Node(data, priority)
-        if self.head is None or priority < self.head.priority:
-            newNode.next = self.head
-            self.head = newNode
-        else:
-            current = self.head
-            while current.next is not None and current.next.priority <= priority:
-                current = current.next
-            newNode.next = current.next
-            current.next = newNode
-
-    def dequeue(self):
-        if self.isEmpty():
-            raise Exception("Priority Queue is empty")
-        result = self.head.data
-        self.head = self.head.next
-        return result
-
-    def peek(self):
-        if self.isEmpty():
-            raise Exception("Priority Queue is empty")
-        return self.head.data
-
-    def isEmpty(self):
-        return self.head is None
-
-    def inFrontier(self, c):
-        tmp = self.head
-        while tmp is not None:
-            if tmp == c:
-                return True
-            tmp = tmp.next
-        return False
-
-class Board:
-    depth = 0 
-
-    def __init__(self, arg1=None, arg2=None, arg3=None):
-        self.rows = [[0 for _ in range(3)] for _ in range(3)]
-        self.parent = None
-        self.depthObject = 0
-
-        if isinstance(arg1, str):
-            num = arg1
-            idxPointer = 0
-            for i in range(3):
-                for j in range(3):
-                    c = num[idxPointer] + ""
-                    idxPointer += 1
-                    self.rows[i][j] = int(c)
-            self.parent = None
-            Board.depth = 0
-            self.depthObject = 0
-
-        elif isinstance(arg1, list) and isinstance(arg2, list) and isinstance(arg3, list):
-            self.rows[0] = arg1
-            self.rows[1] = arg2
-            self.rows[2] = arg3
-            self.parent = None
-            Board.depth = 0
-            self.depthObject = 0
-
-        else:
-            r1 = [0] * 3
-            r2 = [0] * 3
-            r3 = [0] * 3
-            self.rows[0] = r1
-            self.rows[1] = r2
-            self.rows[2] = r3
-            self.parent = None
-            Board.depth = 0
-            self.depthObject = 0
-
-    def blankPos(self):
-        res = [0] * 2
-        for i in range(3):
-            for j in range(3):
-                if self.rows[i][j] == 0:
-                    res[0] = i
-                    res[1] = j
-                    return res
-        return None
-
-    def Pos(self, n):
-        res = [0] * 2
-        for i in range(3):
-            for j in range(3):
-                if self.rows[i][j] == n:
-                    res[0] = i
-                    res[1] = j
-                    return res
-        return None
-
-    def adjElements(self):
-        adj = []
-        corner = 0
-        mid = 0
-        other = 0
-        possibleAdj = 0
-        Blank = self.blankPos()
-
-        if (Blank[0] == 0 or Blank[0] == 2) and (Blank[1] == 0 or Blank[1] == 2):
-            corner = 1
-            possibleAdj = 2
-        elif Blank[0] == 1 and Blank[1] == 1:
-            mid = 1
-            possibleAdj = 4
-        else:
-            other = 1
-            possibleAdj = 3
-
-        adj = [0] * possibleAdj
-
-        if corner == 1:
-            if Blank[0] == 0:
-                adj[0] = self.rows[1][Blank[1]]
-                adj[1] = self.rows[0][1]
-            else:
-                adj[0] = self.rows[1][Blank[1]]
-                adj[1] = self.rows[2][1]
-        elif mid == 1:
-            adj[0] = self.rows[0][1]
-            adj[1] = self.rows[1][0]
-            adj[2] = self.rows[2][1]
-            adj[3] = self.rows[1][2]
-        else:
-            if Blank[0] == 0 or Blank[0] == 2:
-                adj[0] = self.rows[Blank[0]][0]
-                adj[1] = self.rows[1][1] 
-                adj[2] = self.rows[Blank[0]][2]
-            else:
-                adj[0] = self.rows[0][Blank[1]]
-                adj[1] = self.rows[1][1] 
-                adj[2] = self.rows[2][Blank[1]]
-        return adj
-
-    def calcHurstic(self):
-        sum_val = 0
-        for i in range(3):
-            for j in range(3):
-                val = self.rows[i][j]
-                if val == 0: continue
-                target_r = (val - 1) // 3
-                target_c = (val - 1) % 3
-                sum_val += abs(i - target_r) + abs(j - target_c)
-        return sum_val
-
-    def change(self, i, j, element):
-        self.rows[i][j] = element
-
-    def changeAsCopy(self, element):
-        b = Board()
-        for i in range(3):
-            for j in range(3):
-                b.change(i, j, self.rows[i][j])
-
-        posZero = self.blankPos()
-        posTarget = self.Pos(element)
-        b.change(posZero[0], posZero[1], element)
-        b.change(posTarget[0], posTarget[1], 0)
-        b.depthObject = self.depthObject
-        return b
-
-    def Sucssours(self, blist, size, frointer, algorithm):
-        adj = self.adjElements()
-        suc = [None] * len(adj)
-        for i in range(len(adj)):
-            tmp = self.changeAsCopy(adj[i])
-            tmp.parent = self
-            if self.parent is not None:
-                tmp.depthObject = self.parent.depthObject + 1
-            suc[i] = tmp
-
-        for i in range(len(suc)):
-            if not frointer.inFrontier(suc[i]) and not Board.dublicate(suc[i], blist, size):
-                if algorithm.lower() == "a*":
-                    frointer.enqueue(suc[i], suc[i].calcHurstic() + suc[i].depthObject)
-                elif algorithm.lower() == "greedy":
-                    frointer.enqueue(suc[i], suc[i].calcHurstic())
-
-    def getBoardString(self):
-        res = ""
-        for i in range(3):
-            for j in range(3):
-                res += str(self.rows[i][j])
-        return res
-
-    @staticmethod
-    def equal(b1, b2):
-        rows2 = b2.rows
-        rows1 = b1.rows
-        for i in range(3):
-            for j in range(3):
-                if rows1[i][j] != rows2[i][j]:
-                    return False
-        return True
-
-    @staticmethod
-    def dublicate(b, bList, size):
-        for i in range(size):
-            if Board.equal(b, bList[i]):
-                return True
-        return False
-
-class Solver:
-    def __init__(self):
-        self.steps = 0
-        self.timeTaken = 0
-        self.solution = []
-
-    def SolveByGreedy(self, num):
-        startTime = time.time_ns()
-        frontier = PriorityQueue()
-        b = Board(num)
-        bList = [None] * 3000 # Increased buffer slightly
-        counter = 0
-        idx = 0
-        
-        # Check initial state
-        if b.calcHurstic() == 0:
-             self.solution = [b]
-             self.steps = 0
-             self.timeTaken = 0
-             return
-
-        while b.calcHurstic() != 0:
-            if idx >= 2999: break # Safety break
-            bList[idx] = b
-            idx += 1
-            counter += 1
-            b.Sucssours(bList, counter, frontier, "Greedy")
-            if frontier.isEmpty(): break
-            b = frontier.dequeue()
-
-        sum_val = 0
-        idx_sol = 0
-        temp_sol = []
-        
-        curr = b
-        while curr is not None:
-            temp_sol.append(curr)
-            curr = curr.parent
-        
-        # Reverse to get start -> goal
-        self.solution = temp_sol[::-1]
-        self.steps = len(self.solution) - 1
-        endTime = time.time_ns()
-        self.timeTaken = endTime - startTime
-
-    def SolveByAstar(self, num):
-        startTime = time.time_ns()
-        frontier = PriorityQueue()
-        b = Board(num)
-        bList = [None] * 3000
-        counter = 0
-        idx = 0
-        
-        if b.calcHurstic() == 0:
-             self.solution = [b]
-             self.steps = 0
-             self.timeTaken = 0
-             return
-
-        while b.calcHurstic() != 0:
-            if idx >= 2999: break
-            bList[idx] = b
-            idx += 1
-            counter += 1
-            b.Sucssours(bList, counter, frontier, "A*")
-            if frontier.isEmpty(): break
-            b = frontier.dequeue()
-
-        temp_sol = []
-        curr = b
-        while curr is not None:
-            temp_sol.append(curr)
-            curr = curr.parent
-
-        self.solution = temp_sol[::-1]
-        self.steps = len(self.solution) - 1
-        endTime = time.time_ns()
-        self.timeTaken = endTime - startTime
-
-
-def solve_logic_A(start_state):
-    """ Returns: (path_list, time_taken, total_steps) """
-    s=Solver()
-    s.SolveByGreedy(start_state)
-    solutionss=s.solution
-    path = []
-    for b in solutionss:
-        path.append(b.getBoardString())
-    
-    # Handle case where solution is empty or failed
-    if not path: path = [start_state]
-
-    return path, (str(s.timeTaken*10**-9)[:6]), s.steps
-
-def solve_logic_B(start_state):
-    """ Returns: (path_list, time_taken, total_steps) """
-    s=Solver()
-    s.SolveByAstar(start_state)
-    solutionss=s.solution
-    path = []
-    for b in solutionss:
-        path.append(b.getBoardString())
-
-    if not path: path = [start_state]
-
-    return path, (str(s.timeTaken*10**-9)[:6]), s.steps
-
+# the search engine lives in eight_puzzle_engine and is imported on first
+# use, so opening the game hub does not pay for it
 
 # ==========================================
 # GUI LOGIC (Updated Colors)
@@ -351,6 +28,15 @@ class EightPuzzleGUI:
         self.TILE_FG = "#ffffff"        # Puzzle Tile Text
         self.INPUT_BG = "#0f3460"       # Input field background
 
+        # expansion cap for Greedy/A* on 4x4 and 5x5 boards
+        self.LARGE_BOARD_NODE_BUDGET = 200000
+        # seconds before a running search gives up
+        self.SEARCH_TIMEOUT = 60
+
+        # background searches: mode -> SearchMonitor, results come back on self.results
+        self.monitors = {}
+        self.results = None
+
         self.main_frame = tk.Frame(self.root, bg=self.BG_COLOR)
         self.main_frame.pack(fill="both", expand=True)
 
@@ -382,6 +68,12 @@ class EightPuzzleGUI:
         self.input_entry.pack(pady=20, ipady=5)
         self.input_entry.bind('<Return>', self.start_solver)
         
+        # the right panel runs plain A* or anytime ARA*, which shows its best path while it improves
+        self.anytime_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(self.input_frame, text="Anytime ARA* instead of A*", variable=self.anytime_var,
+                       font=("Arial", 12), bg=self.BG_COLOR, fg=self.FG_COLOR, selectcolor=self.INPUT_BG,
+                       activebackground=self.BG_COLOR, activeforeground=self.FG_COLOR).pack(pady=(0, 10))
+
         # Compare Button
         self.create_styled_button(self.input_frame, "COMPARE", self.start_solver, bg_override="#e94560", fg_override="black").pack(pady=10)
 
@@ -403,11 +95,11 @@ class EightPuzzleGUI:
         tk.Frame(self.solver_frame, bg=self.BTN_BG, width=2).place(relx=0.5, rely=0.1, relheight=0.8)
         
         # Build Panels
-        self.lbl_time_A, self.lbl_steps_A, self.lbl_prog_A, self.grid_labels_A = self.create_solver_panel(
+        self.lbl_time_A, self.lbl_steps_A, self.lbl_prog_A, self.grid_labels_A, _ = self.create_solver_panel(
             self.frame_A, "Greedy Algorithm", self.prev_A, self.next_A
         )
         
-        self.lbl_time_B, self.lbl_steps_B, self.lbl_prog_B, self.grid_labels_B = self.create_solver_panel(
+        self.lbl_time_B, self.lbl_steps_B, self.lbl_prog_B, self.grid_labels_B, self.lbl_title_B = self.create_solver_panel(
             self.frame_B, "A* Algorithm", self.prev_B, self.next_B
         )
         
@@ -415,6 +107,9 @@ class EightPuzzleGUI:
         if self.on_back:
              self.create_styled_button(self.solver_frame, "BACK", self.go_back).pack(side="bottom", pady=30)
 
+        self.btn_cancel = self.create_styled_button(self.solver_frame, "CANCEL", self.cancel_solver)
+        self.btn_cancel.pack(side="bottom", pady=(30, 0))
+
 
     def create_styled_button(self, parent, text, command, bg_override=None, fg_override=None):
         """Helper to create GameHub styled buttons"""
@@ -438,7 +133,8 @@ class EightPuzzleGUI:
         return btn
 
     def create_solver_panel(self, parent, title, prev_cmd, next_cmd):
-        tk.Label(parent, text=title, font=("Helvetica", 20, "bold"), bg=self.BG_COLOR, fg=self.ACCENT_COLOR).pack(pady=(40, 15))
+        title_lbl = tk.Label(parent, text=title, font=("Helvetica", 20, "bold"), bg=self.BG_COLOR, fg=self.ACCENT_COLOR)
+        title_lbl.pack(pady=(40, 15))
 
         # Stats Card
         stats = tk.Frame(parent, bg=self.CARD_BG, padx=15, pady=10)
@@ -464,19 +160,7 @@ class EightPuzzleGUI:
         g_cont = tk.Frame(parent, bg=self.BG_COLOR)
         g_cont.pack(pady=10)
         labels = []
-        for r in range(3):
-            for c in range(3):
-                # Placeholder style
-                l = tk.Label(g_cont, 
-                             text="?", 
-                             font=("Helvetica", 24, "bold"), 
-                             width=4, 
-                             height=2, 
-                             bg=self.BTN_BG, 
-                             fg=self.FG_COLOR,
-                             relief="flat")
-                l.grid(row=r, column=c, padx=4, pady=4)
-                labels.append(l)
+        self.build_grid(g_cont, labels, 3)
 
         # Nav Buttons
         nav = tk.Frame(parent, bg=self.BG_COLOR)
@@ -489,43 +173,152 @@ class EightPuzzleGUI:
         btn_next = tk.Button(nav, text="►", command=next_cmd, font=("Arial", 14), bg=self.BTN_BG, fg="white", bd=0, activebackground=self.BTN_ACTIVE, activeforeground="white", width=5)
         btn_next.pack(side="left", padx=10)
 
-        return t_lbl, s_lbl, p_lbl, labels
+        return t_lbl, s_lbl, p_lbl, labels, title_lbl
+
+    def build_grid(self, container, labels, size):
+        """(Re)creates the size x size tile labels inside container, filling labels in place"""
+        for l in labels:
+            l.destroy()
+        labels.clear()
+        font_size = {3: 24, 4: 18}.get(size, 14)
+        for r in range(size):
+            for c in range(size):
+                # Placeholder style
+                l = tk.Label(container, 
+                             text="?", 
+                             font=("Helvetica", font_size, "bold"), 
+                             width=4, 
+                             height=2, 
+                             bg=self.BTN_BG, 
+                             fg=self.FG_COLOR,
+                             relief="flat")
+                l.grid(row=r, column=c, padx=4, pady=4)
+                labels.append(l)
+
+    def parse_input(self, raw_input):
+        """ Returns the board string (one TILE_CHARS character per tile) """
+        from eight_puzzle_engine import TILE_CHARS
+        # "1 2 3 ... 15 0" style input: one number per tile
+        tokens = [t for t in raw_input.replace(",", " ").split() if t]
+        if len(tokens) in (9, 16, 25) and all(t.isdigit() for t in tokens):
+            if all(int(t) < len(tokens) for t in tokens):
+                return "".join(TILE_CHARS[int(t)] for t in tokens)
+        # otherwise one character per tile ("123456780", "123456789ABCDEF0")
+        return "".join([char for char in raw_input.upper() if char in TILE_CHARS])
 
     def start_solver(self, event=None):
+        from eight_puzzle_engine import SearchMonitor, isSolvable, validateBoard
         raw_input = self.input_entry.get()
-        clean_input = "".join([char for char in raw_input if char.isdigit()])
+        clean_input = self.parse_input(raw_input)
 
-        if len(clean_input) != 9:
-            messagebox.showerror("Error", "Please enter exactly 9 digits.")
+        size = math.isqrt(len(clean_input))
+        if size * size != len(clean_input) or size not in (3, 4, 5):
+            messagebox.showerror("Error", "Please enter a 3x3, 4x4 or 5x5 board (9, 16 or 25 tiles).")
+            return
+        error = validateBoard(clean_input)
+        if error is not None:
+            messagebox.showerror("Error", error)
+            return
+        if not isSolvable(clean_input):
+            messagebox.showerror("Unsolvable", "This board cannot reach the goal, no algorithm can solve it.")
             return
 
-        # 1. RUN ALGORITHM A
-        path_a, time_a, steps_a = solve_logic_A(clean_input)
-        self.data_A["path"] = path_a
-        self.data_A["idx"] = 0
-
-        # Update Stats A
-        self.lbl_time_A.config(text=f"{time_a}s")
-        self.lbl_steps_A.config(text=str(steps_a))
-        self.draw_grid(self.grid_labels_A, path_a[0])
-        self.update_label_A()
-
-        # 2. RUN ALGORITHM B
-        path_b, time_b, steps_b = solve_logic_B(clean_input)
-        self.data_B["path"] = path_b
-        self.data_B["idx"] = 0
-
-        # Update Stats B
-        self.lbl_time_B.config(text=f"{time_b}s")
-        self.lbl_steps_B.config(text=str(steps_b))
-        self.draw_grid(self.grid_labels_B, path_b[0])
-        self.update_label_B()
+        # Greedy/A* keep every explored board, so cap them on the bigger boards
+        max_nodes = None if size == 3 else self.LARGE_BOARD_NODE_BUDGET
+
+        # 1. Show the start board on both sides while the searches run
+        for data, grid, lbl_time, lbl_steps in ((self.data_A, self.grid_labels_A, self.lbl_time_A, self.lbl_steps_A),
+                                                (self.data_B, self.grid_labels_B, self.lbl_time_B, self.lbl_steps_B)):
+            data["path"] = [clean_input]
+            data["idx"] = 0
+            lbl_time.config(text="0s")
+            lbl_steps.config(text="solving...")
+            self.draw_grid(grid, clean_input)
+
+        # 2. Run Greedy and A* (or ARA*) in worker threads; poll_solver picks up the results
+        mode_B = "ara*" if self.anytime_var.get() else "a*"
+        self.lbl_title_B.config(text="ARA* Algorithm" if mode_B == "ara*" else "A* Algorithm")
+        self.results = queue.Queue()
+        self.monitors = {}
+        for mode in ("greedy", mode_B):
+            # ARA* gets the timeout as its own time limit, so it returns its best path instead of nothing
+            monitor = SearchMonitor(None if mode == "ara*" else self.SEARCH_TIMEOUT)
+            self.monitors[mode] = monitor
+            threading.Thread(target=self.run_search, args=(mode, clean_input, max_nodes, monitor, self.results),
+                             daemon=True).start()
+        self.btn_cancel.config(state="normal")
+        self.poll_solver(self.results)
 
         # 3. Switch Screen
         self.input_frame.pack_forget()
         self.solver_frame.pack(fill="both", expand=True)
 
+    def run_search(self, mode, start_state, max_nodes, monitor, results):
+        # worker thread: never touches Tk, the result goes back through the queue
+        from eight_puzzle_engine import SearchStopped, SolveResult, run_solver, solutionCache
+        time_limit = self.SEARCH_TIMEOUT if mode == "ara*" else None
+        try:
+            res = run_solver(start_state, mode, max_nodes, hooks=monitor, cache=solutionCache, time_limit=time_limit)
+        except SearchStopped as e:
+            # a cancelled anytime search still hands back its best path so far
+            res = SolveResult(start_state, str(e), path=monitor.latestPath, seconds=monitor.seconds(),
+                              expanded=monitor.expanded)
+        except Exception as e:
+            # anything else still has to reach poll_solver, or it waits forever
+            res = SolveResult(start_state, "error", seconds=monitor.seconds(), expanded=monitor.expanded,
+                              message="%s: %s" % (type(e).__name__, e))
+        results.put((mode, res))
+
+    def poll_solver(self, results):
+        if results is not self.results:
+            return  # a newer run (or go_back) replaced this one
+
+        while not results.empty():
+            mode, res = results.get_nowait()
+            del self.monitors[mode]
+            self.show_result(mode, res)
+
+        for mode, monitor in self.monitors.items():
+            lbl_time, lbl_prog = (self.lbl_time_A, self.lbl_prog_A) if mode == "greedy" else (self.lbl_time_B, self.lbl_prog_B)
+            lbl_time.config(text=f"{monitor.seconds():.1f}s")
+            progress = f"Expanded: {monitor.expanded}  Frontier: {monitor.frontierSize()}"
+            if monitor.latestPath is not None:
+                # anytime searches report their best path so far
+                progress += f"  Best: {len(monitor.latestPath) - 1} steps"
+            lbl_prog.config(text=progress)
+
+        if self.monitors:
+            self.root.after(100, self.poll_solver, results)
+        else:
+            self.btn_cancel.config(state="disabled")
+
+    def show_result(self, mode, res):
+        if mode == "greedy":
+            data, lbl_time, lbl_steps, lbl_prog, grid, update_label = self.data_A, self.lbl_time_A, self.lbl_steps_A, self.lbl_prog_A, self.grid_labels_A, self.update_label_A
+        else:
+            data, lbl_time, lbl_steps, lbl_prog, grid, update_label = self.data_B, self.lbl_time_B, self.lbl_steps_B, self.lbl_prog_B, self.grid_labels_B, self.update_label_B
+        data["path"] = res.path
+        data["idx"] = 0
+        lbl_time.config(text=f"{res.seconds:.4f}s")
+        if res.solved():
+            lbl_steps.config(text=str(res.steps))
+        elif res.moves:
+            lbl_steps.config(text=f"{res.status} (best {len(res.moves)})")
+        else:
+            lbl_steps.config(text=res.status)
+        self.draw_grid(grid, res.path[0])
+        update_label()
+        if res.status == "error":
+            lbl_prog.config(text=res.message)
+
+    def cancel_solver(self):
+        for monitor in self.monitors.values():
+            monitor.cancelled.set()
+
     def draw_grid(self, label_list, state_string):
+        from eight_puzzle_engine import TILE_CHARS
+        if len(label_list) != len(state_string):
+            self.build_grid(label_list[0].master, label_list, math.isqrt(len(state_string)))
         for i, char in enumerate(state_string):
             lbl = label_list[i]
             if char == '0':
@@ -533,7 +326,7 @@ class EightPuzzleGUI:
                 lbl.config(text="", bg=self.BTN_BG) 
             else:
                 # Active Tile Style (GameHub Accent Color)
-                lbl.config(text=char, bg=self.ACCENT_COLOR, fg="white")
+                lbl.config(text=str(TILE_CHARS.index(char)), bg=self.ACCENT_COLOR, fg="white")
 
     def prev_A(self):
         if self.data_A["idx"] > 0:
@@ -566,6 +359,8 @@ class EightPuzzleGUI:
         self.lbl_prog_B.config(text=f"Step: {self.data_B['idx']} / {len(self.data_B['path']) - 1}")
         
     def go_back(self):
+        self.cancel_solver()
+        self.results = None
         if hasattr(self, 'main_frame') and self.main_frame:
             self.main_frame.destroy()
         if self.on_back:
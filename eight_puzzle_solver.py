@@ -1,410 +1,8 @@
 import tkinter as tk
 from tkinter import messagebox
-import time
-
-import time
 import math
 
-
-class Node:
-    def __init__(self, data, priority):
-        self.data = data
-        self.priority = priority
-        self.next = None
-
-
-
-class PriorityQueue:
-    def __init__(self): 
-        self.head = None
-
-    def enqueue(self, data, priority):
-        newNode = Node(data, priority)
-
-        if self.head is None or priority < self.head.priority:
-            newNode.next = self.head
-            self.head = newNode
-        else:
-            current = self.head
-            while current.next is not None and current.next.priority <= priority:
-                current = current.next
-
-            newNode.next = current.next
-            current.next = newNode
-
-    def dequeue(self):
-        if self.isEmpty():
-            raise Exception("Priority Queue is empty")
-
-        result = self.head.data
-        self.head = self.head.next
-        return result
-
-    def peek(self):
-        if self.isEmpty():
-            raise Exception("Priority Queue is empty")
-        return self.head.data
-
-    def isEmpty(self):
-        return self.head is None
-
-    def printQueue(self):
-        current = self.head
-        while current is not None:
-            print("(" + str(current.data) + ", priority: " + str(current.priority) + ") -> ", end="")
-            current = current.next
-        print("null")
-
-    def inFrontier(self, c):
-        tmp = self.head
-        while tmp is not None:
-            if tmp == c:
-                return True
-            tmp = tmp.next
-        return False
-
-
-class Board:
-    depth = 0  # static variable
-
-    def __init__(self, arg1=None, arg2=None, arg3=None):
-        self.rows = [[0 for _ in range(3)] for _ in range(3)]
-        self.parent = None
-        self.depthObject = 0
-
-        if isinstance(arg1, str):
-            num = arg1
-            idxPointer = 0
-            for i in range(3):
-                for j in range(3):
-                    c = num[idxPointer] + ""
-                    idxPointer += 1
-                    self.rows[i][j] = int(c)
-            self.parent = None
-            Board.depth = 0
-            self.depthObject = 0
-
-        elif isinstance(arg1, list) and isinstance(arg2, list) and isinstance(arg3, list):
-            self.rows[0] = arg1
-            self.rows[1] = arg2
-            self.rows[2] = arg3
-            self.parent = None
-            Board.depth = 0
-            self.depthObject = 0
-
-        else:
-            r1 = [0] * 3
-            r2 = [0] * 3
-            r3 = [0] * 3
-            self.rows[0] = r1
-            self.rows[1] = r2
-            self.rows[2] = r3
-            self.parent = None
-            Board.depth = 0
-            self.depthObject = 0
-
-    def print(self):
-        for j in range(3):
-            for i in range(3):
-                print(str(self.rows[j][i]) + " ", end="")
-            print()
-        print("-----")
-
-    def blankPos(self):
-        res = [0] * 2
-        for i in range(3):
-            for j in range(3):
-                if self.rows[i][j] == 0:
-                    res[0] = i
-                    res[1] = j
-                    return res
-        return None
-
-    def Pos(self, n):
-        res = [0] * 2
-        for i in range(3):
-            for j in range(3):
-                if self.rows[i][j] == n:
-                    res[0] = i
-                    res[1] = j
-                    return res
-        return None
-
-    def adjElements(self):
-        adj = []
-        corner = 0
-        mid = 0
-        other = 0
-
-        possibleAdj = 0
-        Blank = self.blankPos()
-
-		
-        if (Blank[0] == 0 or Blank[0] == 2) and (Blank[1] == 0 or Blank[1] == 2):
-            corner = 1
-            possibleAdj = 2
-        elif Blank[0] == 1 and Blank[1] == 1:
-            mid = 1
-            possibleAdj = 4
-        else:
-            other = 1
-            possibleAdj = 3
-
-        adj = [0] * possibleAdj
-
-        if corner == 1:
-            if Blank[0] == 0:
-                adj[0] = self.rows[1][Blank[1]]
-                adj[1] = self.rows[0][1]
-            else:
-                adj[0] = self.rows[1][Blank[1]]
-                adj[1] = self.rows[2][1]
-        elif mid == 1:
-            adj[0] = self.rows[0][1]
-            adj[1] = self.rows[1][0]
-            adj[2] = self.rows[2][1]
-            adj[3] = self.rows[1][2]
-        else:
-            if Blank[0] == 0 or Blank[0] == 2:
-                adj[0] = self.rows[Blank[0]][0]
-                adj[1] = self.rows[1][1]  # mid
-                adj[2] = self.rows[Blank[0]][2]
-            else:
-                adj[0] = self.rows[0][Blank[1]]
-                adj[1] = self.rows[1][1]  # mid
-                adj[2] = self.rows[2][Blank[1]]
-
-        return adj
-
-    def calcHurstic(self):
-        sum_val = 0
-
-        for i in range(3):
-            for j in range(3):
-                if self.rows[i][j] == 1:
-                    sum_val += abs(i - 0) + abs(j - 0)
-                elif self.rows[i][j] == 2:
-                    sum_val += abs(i - 0) + abs(j - 1)
-                elif self.rows[i][j] == 3:
-                    sum_val += abs(i - 0) + abs(j - 2)
-                elif self.rows[i][j] == 4:
-                    sum_val += abs(i - 1) + abs(j - 0)
-                elif self.rows[i][j] == 5:
-                    sum_val += abs(i - 1) + abs(j - 1)
-                elif self.rows[i][j] == 6:
-                    sum_val += abs(i - 1) + abs(j - 2)
-                elif self.rows[i][j] == 7:
-                    sum_val += abs(i - 2) + abs(j - 0)
-                elif self.rows[i][j] == 8:
-                    sum_val += abs(i - 2) + abs(j - 1)
-                else:
-                    continue
-        return sum_val
-
-    def change(self, i, j, element):
-        self.rows[i][j] = element
-
-    def Copy(self, element):
-        b = Board()
-        for i in range(3):
-            for j in range(3):
-                b.change(i, j, self.rows[i][j])
-        return b
-
-    def changeAsCopy(self, element):
-        b = Board()
-        for i in range(3):
-            for j in range(3):
-                b.change(i, j, self.rows[i][j])
-
-		
-        posZero = self.blankPos()
-        posTarget = self.Pos(element)
-        b.change(posZero[0], posZero[1], element)
-        b.change(posTarget[0], posTarget[1], 0)
-        b.depthObject = self.depthObject
-        return b
-
-    def Sucssours(self, blist, size, frointer, algorithm):  #
-        adj = self.adjElements()
-
-        bl = []  # ArrayList<Board>
-
-        suc = [None] * len(adj)
-        idx = 0
-        for i in range(len(adj)):
-            tmp = self.changeAsCopy(adj[i])
-            tmp.parent = self
-            if self.parent is not None:
-                tmp.depthObject = self.parent.depthObject + 1
-            suc[i] = tmp
-
-        for i in range(len(suc)):
-            if not frointer.inFrontier(suc[i]) and not Board.dublicate(suc[i], blist, size):
-                if algorithm.lower() == "a*":
-                    frointer.enqueue(suc[i], suc[i].calcHurstic() + suc[i].depthObject)
-                elif algorithm.lower() == "greedy":
-                    frointer.enqueue(suc[i], suc[i].calcHurstic())
-
-
-    def getBoardString(self):
-        res = ""
-        for i in range(3):
-            for j in range(3):
-                res += str(self.rows[i][j])
-        return res
-
-    @staticmethod
-    def equal(b1, b2):
-        rows2 = b2.rows
-        rows1 = b1.rows
-
-        for i in range(3):
-            for j in range(3):
-                if rows1[i][j] != rows2[i][j]:
-                    return False
-
-        return True
-
-    @staticmethod
-    def dublicate(b, bList, size):
-        for i in range(size):
-            if Board.equal(b, bList[i]):
-                return True
-        return False
-
-
-
-class Solver:
-    def __init__(self):
-        self.steps = 0
-        self.timeTaken = 0
-        self.solution = []
-
-    def SolveByGreedy(self, num):
-        startTime = time.time_ns()
-        explore = []  # ArrayList<Board>
-        frontier = PriorityQueue()
-        b = Board(num)
-
-        bList = [None] * 1000
-        counter = 0
-        idx = 0
-        while b.calcHurstic() != 0:
-            bList[idx] = b
-            idx += 1
-            counter += 1
-            b.Sucssours(bList, counter, frontier, "Greedy")
-            b = frontier.dequeue()
-
-        sum_val = 0
-        # b.print();
-        idx = 999
-        sol = [None] * 1000
-
-        while b.parent is not None:
-            sol[idx] = b
-            idx -= 1
-            b = b.parent
-
-        sol[idx] = b
-
-        finalSol = [None] * (1000 - idx)
-        c = 0
-        for i in range(idx, 1000):
-            finalSol[c] = sol[i]
-            c += 1
-            sum_val += 1
-
-        self.solution = finalSol
-        self.steps = sum_val - 1
-        endTime = time.time_ns()
-        self.timeTaken = endTime - startTime
-
-    def SolveByAstar(self, num):
-        startTime = time.time_ns()
-        explore = []  # ArrayList<Board>
-        frontier = PriorityQueue()
-        b = Board(num)
-
-        bList = [None] * 1000
-        counter = 0
-        idx = 0
-        while b.calcHurstic() != 0:
-            bList[idx] = b
-            idx += 1
-            counter += 1
-            b.Sucssours(bList, counter, frontier, "A*")
-            b = frontier.dequeue()
-
-        sum_val = 0
-        idx = 999
-        sol = [None] * 1000
-
-        while b.parent is not None:
-            sol[idx] = b
-            idx -= 1
-            b = b.parent
-
-        sol[idx] = b
-
-        finalSol = [None] * (1000 - idx)
-        c = 0
-        for i in range(idx, 1000):
-            finalSol[c] = sol[i]
-            c += 1
-            sum_val += 1
-
-        self.solution = finalSol
-        self.steps = sum_val - 1
-        endTime = time.time_ns()
-        self.timeTaken = endTime - startTime
-
-    def print(self):
-        for i in range(len(self.solution)):
-            self.solution[i].print()
-
-
-
-def solve_logic_A(start_state):
-    s=Solver()
-    s.SolveByGreedy(start_state)
-    solutionss=s.solution
-    path = [start_state]
-    t=1
-    for i in solutionss:
-        if(t==1):
-            t=t+1
-            temp = list(start_state)
-            path.append("".join(temp))
-            continue
-        b = i
-        result_string = b.getBoardString()
-        path.append(result_string)
-
-    return path, (str(s.timeTaken*10**-9)[:5]), s.steps
-
-
-
-def solve_logic_B(start_state):
-
-    s=Solver()
-    s.SolveByAstar(start_state)
-    solutionss=s.solution
-    t=1
-    for i in solutionss:
-        if(t==1):
-            path = [start_state]
-            t=t+1
-            temp = list(start_state)
-            path.append("".join(temp))
-            continue
-        b = i
-        result_string = b.getBoardString()
-        path.append(result_string)
-
-    return path, (str(s.timeTaken*10**-9)[:5]), s.steps
-
+# the search engine lives in eight_puzzle_engine and is imported on first use
 
 
 data_A = {"path": [], "idx": 0}
@@ -412,42 +10,69 @@ data_B = {"path": [], "idx": 0}
 
 
 def start_solver(event=None):
+    from eight_puzzle_engine import TILE_CHARS, isSolvable, solve_logic_A, solve_logic_B, validateBoard
     raw_input = input_entry.get()
-    clean_input = "".join([char for char in raw_input if char.isdigit()])
+    clean_input = "".join([char for char in raw_input.upper() if char in TILE_CHARS])
 
-    if len(clean_input) != 9:
-        messagebox.showerror("Error", "Please enter exactly 9 digits.")
+    size = math.isqrt(len(clean_input))
+    if size * size != len(clean_input) or size not in (3, 4, 5):
+        messagebox.showerror("Error", "Please enter a 3x3, 4x4 or 5x5 board (9, 16 or 25 tiles).")
+        return
+    error = validateBoard(clean_input)
+    if error is not None:
+        messagebox.showerror("Error", error)
         return
+    if not isSolvable(clean_input):
+        messagebox.showerror("Unsolvable", "This board cannot reach the goal, no algorithm can solve it.")
+        return
+
+    # Greedy/A* keep every explored board, so cap them on the bigger boards
+    max_nodes = None if size == 3 else 200000
 
-    path_a, time_a, steps_a = solve_logic_A(clean_input)
-    data_A["path"] = path_a
+    res_a = solve_logic_A(clean_input, max_nodes)
+    data_A["path"] = res_a.path
     data_A["idx"] = 0
 
-    lbl_time_A.config(text=f"{time_a}s")
-    lbl_steps_A.config(text=str(steps_a))
-    draw_grid(grid_labels_A, path_a[0])
+    lbl_time_A.config(text=f"{res_a.seconds:.4f}s")
+    lbl_steps_A.config(text=str(res_a.steps if res_a.solved() else res_a.status))
+    draw_grid(grid_labels_A, res_a.path[0])
     update_label_A()
 
-    path_b, time_b, steps_b = solve_logic_B(clean_input)
-    data_B["path"] = path_b
+    res_b = solve_logic_B(clean_input, max_nodes)
+    data_B["path"] = res_b.path
     data_B["idx"] = 0
 
-    lbl_time_B.config(text=f"{time_b}s")
-    lbl_steps_B.config(text=str(steps_b))
-    draw_grid(grid_labels_B, path_b[0])
+    lbl_time_B.config(text=f"{res_b.seconds:.4f}s")
+    lbl_steps_B.config(text=str(res_b.steps if res_b.solved() else res_b.status))
+    draw_grid(grid_labels_B, res_b.path[0])
     update_label_B()
 
     input_frame.pack_forget()
     solver_frame.pack(fill="both", expand=True)
 
 
+def build_grid(container, labels, size):
+    for l in labels:
+        l.destroy()
+    labels.clear()
+    for r in range(size):
+        for c in range(size):
+            l = tk.Label(container, text="?", font=("Helvetica", 24 if size == 3 else 16, "bold"), width=4, height=2,
+                         bg="#e0e0e0", fg="#333", relief="flat")
+            l.grid(row=r, column=c, padx=3, pady=3)
+            labels.append(l)
+
+
 def draw_grid(label_list, state_string):
+    from eight_puzzle_engine import TILE_CHARS
+    if len(label_list) != len(state_string):
+        build_grid(label_list[0].master, label_list, math.isqrt(len(state_string)))
     for i, char in enumerate(state_string):
         lbl = label_list[i]
         if char == '0':
             lbl.config(text="", bg="#f0f0f0")
         else:
-            lbl.config(text=char, bg="#2196F3", fg="white")
+            lbl.config(text=str(TILE_CHARS.index(char)), bg="#2196F3", fg="white")
 
 
 def prev_A():
@@ -547,12 +172,7 @@ def create_solver_panel(parent, title, time_lbl_var, steps_lbl_var, prog_lbl_var
     g_cont = tk.Frame(parent, bg="white")
     g_cont.pack(pady=5)
     labels = []
-    for r in range(3):
-        for c in range(3):
-            l = tk.Label(g_cont, text="?", font=("Helvetica", 24, "bold"), width=4, height=2, bg="#e0e0e0", fg="#333",
-                         relief="flat")
-            l.grid(row=r, column=c, padx=3, pady=3)
-            labels.append(l)
+    build_grid(g_cont, labels, 3)
 
 
     nav = tk.Frame(parent, bg="white")
@@ -0,0 +1,34 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from eight_puzzle_benchmark import make_corpus
+from eight_puzzle_engine import DistanceTable, Solver, verify_optimality
+
+# one board per optimal depth 0..20 keeps the BFS reference run short
+CORPUS = make_corpus(seed=0, per_depth=1, depths=range(21))
+
+SOLVE_METHODS = {
+    "a*": "SolveByAstar",
+    "ida*": "SolveByIDAstar",
+    "bidirectional": "SolveByBidirectional",
+    "bfs": "SolveByBFS",
+}
+
+
+def test_optimal_modes_match_bfs():
+    assert verify_optimality([num for _, num in CORPUS]) == []
+
+
+@pytest.mark.parametrize("mode", sorted(SOLVE_METHODS))
+def test_steps_match_distance_table(mode):
+    table = DistanceTable.load()
+    for depth, num in CORPUS:
+        s = Solver()
+        getattr(s, SOLVE_METHODS[mode])(num)
+        assert s.status == "solved", num
+        assert s.steps == table.lookup(num) == depth, num
+        assert len(s.path) == s.steps + 1, num